@@ -1,14 +1,23 @@
+#define _POSIX_C_SOURCE 200809L
+
 #include "raspberry_pi_core.h"
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <unistd.h>
+#include <errno.h>
+#include <ctype.h>
 #include <time.h>
 
+// Console output is fully buffered and flushed only before the demo blocks
+#define DEMO_OUTPUT_BUFFER_SIZE 16384
+
 // Demo system structure
 typedef struct {
     raspberry_pi_core_t *core;
     bool simulation_mode;
+    bool json_output;       // Print each demo summary as one JSON line
+    bool auto_mode;         // Run all demos without waiting for Enter
 } demo_system_t;
 
 // Function prototypes
@@ -20,7 +29,35 @@ void demo_2_water_pump_implementation(demo_system_t *demo);
 void demo_3_sensor_implementation(demo_system_t *demo);
 void demo_4_sensors_database_ui_sync(demo_system_t *demo);
 void demo_5_system_integration_touchscreen(demo_system_t *demo);
-void run_all_demos(demo_system_t *demo);
+void run_all_milestone_demos(demo_system_t *demo);
+
+// Start a fixed-period schedule at the current time
+static void demo_start_ticks(struct timespec *next_tick) {
+    clock_gettime(CLOCK_MONOTONIC, next_tick);
+}
+
+// Sleep until the next tick of a fixed-period schedule. Time spent on work
+// inside the tick (sensor reads, pump runs) is absorbed into the period
+// instead of being added on top of it.
+static void demo_wait_next_tick(struct timespec *next_tick, unsigned int period_seconds) {
+    fflush(stdout);
+    next_tick->tv_sec += period_seconds;
+    while (clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, next_tick, NULL) == EINTR) {
+        // Restart the wait if interrupted by a signal
+    }
+}
+
+// Flush pending output and pause
+static void demo_pause(unsigned int seconds) {
+    fflush(stdout);
+    sleep(seconds);
+}
+
+// Flush pending output before a pump run blocks for its duration
+static bool demo_control_pump(demo_system_t *demo, int pump_number, float duration_seconds, float water_amount_ml) {
+    fflush(stdout);
+    return control_pump(demo->core->hardware, pump_number, duration_seconds, water_amount_ml);
+}
 
 demo_system_t* demo_init(bool simulation_mode) {
     demo_system_t *demo = malloc(sizeof(demo_system_t));
@@ -30,6 +67,8 @@ demo_system_t* demo_init(bool simulation_mode) {
     }
     
     demo->simulation_mode = simulation_mode;
+    demo->json_output = false;
+    demo->auto_mode = false;
     demo->core = pi_core_init(simulation_mode, NULL);
     
     if (!demo->core) {
@@ -90,16 +129,23 @@ void demo_1_plant_ui_database(demo_system_t *demo) {
     
     // Simulate web interface running
     printf("\n🌐 Web interface running for 10 seconds...\n");
+    struct timespec next_tick;
+    demo_start_ticks(&next_tick);
     for (int i = 0; i < 10; i++) {
         printf("   → Web interface active: %d/10 seconds\n", i + 1);
-        sleep(1);
+        demo_wait_next_tick(&next_tick, 1);
     }
     
-    printf("\n✅ Demo 1 Complete!\n");
-    printf("   - Web UI: Functional\n");
-    printf("   - Database: %d plants available\n", demo->core->active_plants_count);
-    printf("   - Plant Management: Add/Modify working\n");
-    printf("   - Configuration: %d plants active\n", demo->core->active_plants_count);
+    if (demo->json_output) {
+        printf("{\"demo\":1,\"plants\":%d,\"active\":%d,\"web\":\"ok\"}\n",
+               demo->core->active_plants_count, demo->core->active_plants_count);
+    } else {
+        printf("\n✅ Demo 1 Complete!\n");
+        printf("   - Web UI: Functional\n");
+        printf("   - Database: %d plants available\n", demo->core->active_plants_count);
+        printf("   - Plant Management: Add/Modify working\n");
+        printf("   - Configuration: %d plants active\n", demo->core->active_plants_count);
+    }
 }
 
 void demo_2_water_pump_implementation(demo_system_t *demo) {
@@ -118,14 +164,12 @@ void demo_2_water_pump_implementation(demo_system_t *demo) {
     
     printf("\n💧 Testing Pump 1...\n");
     printf("   - Starting pump for 3 seconds...\n");
-    bool success1 = control_pump(demo->core->hardware, 1, 3.0, 150);
+    bool success1 = demo_control_pump(demo, 1, 3.0, 150);
     printf("   - Pump 1 result: %s\n", success1 ? "✅ Success" : "❌ Failed");
     
-    sleep(1);
-    
     printf("\n💧 Testing Pump 2...\n");
     printf("   - Starting pump for 2 seconds...\n");
-    bool success2 = control_pump(demo->core->hardware, 2, 2.0, 100);
+    bool success2 = demo_control_pump(demo, 2, 2.0, 100);
     printf("   - Pump 2 result: %s\n", success2 ? "✅ Success" : "❌ Failed");
     
     printf("\n🤖 Testing Automatic Watering...\n");
@@ -133,30 +177,40 @@ void demo_2_water_pump_implementation(demo_system_t *demo) {
     int count = pi_core_check_plants_needing_water(demo->core, plants_needing_water);
     printf("   - Plants needing water: %d\n", count);
     
-    for (int i = 0; i < count; i++) {
-        const plant_t *plant = &plants_needing_water[i];
-        printf("   - Watering %s at position %d with %.0fml\n", 
-               plant->name, plant->position, plant->water_amount);
-        
-        float duration = plant->water_amount / 100.0; // seconds
-        int pump_num = (plant->position % 2) + 1; // Alternate between pumps
+    if (count > 0) {
+        pump_job_t jobs[10];
+        for (int i = 0; i < count; i++) {
+            const plant_t *plant = &plants_needing_water[i];
+            printf("   - Watering %s at position %d with %.0fml\n", 
+                   plant->name, plant->position, plant->water_amount);
+            
+            jobs[i].pump_number = (plant->position % 2) + 1; // Alternate between pumps
+            jobs[i].duration_seconds = plant->water_amount / 100.0; // seconds
+            jobs[i].water_amount_ml = plant->water_amount;
+        }
         
-        bool success = control_pump(demo->core->hardware, pump_num, duration, plant->water_amount);
+        // Both pumps run together, so the batch takes as long as the busiest pump
+        fflush(stdout);
+        bool success = control_pumps_batch(demo->core->hardware, jobs, count);
         printf("     Result: %s\n", success ? "✅ Success" : "❌ Failed");
-        
-        sleep(1);
     }
     
     printf("\n🛡️  Testing Safety Features...\n");
     printf("   - Testing pump timeout (5 seconds max)...\n");
-    bool success = control_pump(demo->core->hardware, 1, 5.0, 500);
+    bool success = demo_control_pump(demo, 1, 5.0, 500);
     printf("   - Long duration test: %s\n", success ? "✅ Completed safely" : "❌ Failed");
     
-    printf("\n✅ Demo 2 Complete!\n");
-    printf("   - Pump 1: %s\n", success1 ? "✅ Working" : "❌ Failed");
-    printf("   - Pump 2: %s\n", success2 ? "✅ Working" : "❌ Failed");
-    printf("   - Automatic watering: %s\n", count > 0 ? "✅ Functional" : "✅ No plants need water");
-    printf("   - Safety features: ✅ Active\n");
+    if (demo->json_output) {
+        printf("{\"demo\":2,\"pump1\":%s,\"pump2\":%s,\"plants_watered\":%d,\"safety\":%s}\n",
+               success1 ? "true" : "false", success2 ? "true" : "false", count,
+               success ? "true" : "false");
+    } else {
+        printf("\n✅ Demo 2 Complete!\n");
+        printf("   - Pump 1: %s\n", success1 ? "✅ Working" : "❌ Failed");
+        printf("   - Pump 2: %s\n", success2 ? "✅ Working" : "❌ Failed");
+        printf("   - Automatic watering: %s\n", count > 0 ? "✅ Functional" : "✅ No plants need water");
+        printf("   - Safety features: ✅ Active\n");
+    }
 }
 
 void demo_3_sensor_implementation(demo_system_t *demo) {
@@ -198,7 +252,7 @@ void demo_3_sensor_implementation(demo_system_t *demo) {
     printf("   ✅ Tank Percentage: %.1f%%\n", water_percentage);
     
     printf("\n📊 Testing Comprehensive Sensor Reading...\n");
-    sensor_data_t all_sensors = read_all_sensors(demo->core->hardware);
+    sensor_data_t all_sensors = pi_core_read_all_sensors(demo->core);
     printf("   ✅ All sensors read successfully:\n");
     printf("      - Temperature: %.1f°C\n", all_sensors.temperature_celsius);
     printf("      - Humidity: %.1f%%\n", all_sensors.humidity_percent);
@@ -219,21 +273,30 @@ void demo_3_sensor_implementation(demo_system_t *demo) {
     }
     
     printf("\n⏱️  Testing Continuous Monitoring (5 readings)...\n");
+    struct timespec next_tick;
+    demo_start_ticks(&next_tick);
     for (int i = 0; i < 5; i++) {
-        sensor_data_t readings = read_all_sensors(demo->core->hardware);
+        sensor_data_t readings = pi_core_read_all_sensors(demo->core);
         printf("   Reading %d: Temp=%.1f°C, Humidity=%.1f%%, Soil=%.1f%%, Light=%.1f lux\n",
                i + 1, readings.temperature_celsius, readings.humidity_percent,
                readings.soil_moisture_percent, readings.light_lux);
-        sleep(2);
+        demo_wait_next_tick(&next_tick, 2);
     }
     
-    printf("\n✅ Demo 3 Complete!\n");
-    printf("   - DHT22: %s\n", dht22_success ? "✅ Working" : "❌ Failed");
-    printf("   - Soil Moisture: ✅ Working\n");
-    printf("   - Light Sensor: ✅ Working\n");
-    printf("   - Water Level: ✅ Working\n");
-    printf("   - Data Validation: ✅ Functional\n");
-    printf("   - Continuous Monitoring: ✅ Stable\n");
+    if (demo->json_output) {
+        printf("{\"demo\":3,\"dht22\":%s,\"temperature_celsius\":%.1f,\"humidity_percent\":%.1f,"
+               "\"soil_moisture_percent\":%.1f,\"light_lux\":%.1f,\"water_tank_percentage\":%.1f}\n",
+               dht22_success ? "true" : "false", all_sensors.temperature_celsius, all_sensors.humidity_percent,
+               all_sensors.soil_moisture_percent, all_sensors.light_lux, all_sensors.water_tank_percentage);
+    } else {
+        printf("\n✅ Demo 3 Complete!\n");
+        printf("   - DHT22: %s\n", dht22_success ? "✅ Working" : "❌ Failed");
+        printf("   - Soil Moisture: ✅ Working\n");
+        printf("   - Light Sensor: ✅ Working\n");
+        printf("   - Water Level: ✅ Working\n");
+        printf("   - Data Validation: ✅ Functional\n");
+        printf("   - Continuous Monitoring: ✅ Stable\n");
+    }
 }
 
 void demo_4_sensors_database_ui_sync(demo_system_t *demo) {
@@ -251,33 +314,35 @@ void demo_4_sensors_database_ui_sync(demo_system_t *demo) {
     printf("\n📊 Simulating Environmental Changes...\n");
     
     printf("   1. Adding water to soil...\n");
-    sleep(2);
-    sensor_data_t sensor_data = read_all_sensors(demo->core->hardware);
+    demo_pause(2);
+    sensor_data_t sensor_data = pi_core_read_all_sensors(demo->core);
     printf("      Soil moisture: %.1f%%\n", sensor_data.soil_moisture_percent);
     
     printf("   2. Changing light conditions...\n");
-    sleep(2);
-    sensor_data = read_all_sensors(demo->core->hardware);
+    demo_pause(2);
+    sensor_data = pi_core_read_all_sensors(demo->core);
     printf("      Light level: %.1f lux\n", sensor_data.light_lux);
     
     printf("   3. Simulating water tank level change...\n");
-    sleep(2);
-    sensor_data = read_all_sensors(demo->core->hardware);
+    demo_pause(2);
+    sensor_data = pi_core_read_all_sensors(demo->core);
     printf("      Water tank: %.1f%%\n", sensor_data.water_tank_percentage);
     
     printf("\n💾 Testing Database Logging...\n");
     printf("   - Sensor readings logged: %d\n", demo->core->system_status.sensor_history_count);
     
     printf("\n⚡ Testing Real-time Data Updates...\n");
+    struct timespec next_tick;
+    demo_start_ticks(&next_tick);
     for (int i = 0; i < 3; i++) {
-        sensor_data_t current_data = read_all_sensors(demo->core->hardware);
+        sensor_data_t current_data = pi_core_read_all_sensors(demo->core);
         char timestamp_str[64];
         pi_core_format_timestamp(current_data.timestamp, timestamp_str, sizeof(timestamp_str));
         printf("   Update %d: %s\n", i + 1, timestamp_str);
         printf("      - Temperature: %.1f°C\n", current_data.temperature_celsius);
         printf("      - Soil Moisture: %.1f%%\n", current_data.soil_moisture_percent);
         printf("      - Water Level: %.1f%%\n", current_data.water_tank_percentage);
-        sleep(3);
+        demo_wait_next_tick(&next_tick, 3);
     }
     
     printf("\n🌐 Testing UI Data Synchronization...\n");
@@ -285,6 +350,7 @@ void demo_4_sensors_database_ui_sync(demo_system_t *demo) {
     printf("   - Access at: http://localhost:8080\n");
     
     printf("   - Simulating live data changes...\n");
+    demo_start_ticks(&next_tick);
     for (int i = 0; i < 5; i++) {
         if (i == 2) {
             printf("     → Triggering automatic watering...\n");
@@ -292,23 +358,28 @@ void demo_4_sensors_database_ui_sync(demo_system_t *demo) {
             int count = pi_core_check_plants_needing_water(demo->core, plants_needing_water);
             if (count > 0) {
                 const plant_t *plant = &plants_needing_water[0];
-                control_pump(demo->core->hardware, 1, 2.0, plant->water_amount);
+                demo_control_pump(demo, 1, 2.0, plant->water_amount);
             }
         }
         
-        sensor_data_t sensor_data = read_all_sensors(demo->core->hardware);
+        sensor_data_t sensor_data = pi_core_read_all_sensors(demo->core);
         char timestamp_str[64];
         pi_core_format_timestamp(sensor_data.timestamp, timestamp_str, sizeof(timestamp_str));
         printf("     → Live update %d: %s\n", i + 1, timestamp_str);
-        sleep(4);
+        demo_wait_next_tick(&next_tick, 4);
     }
     
-    printf("\n✅ Demo 4 Complete!\n");
-    printf("   - Data Pipeline: ✅ Sensor → Database → UI\n");
-    printf("   - Real-time Updates: ✅ Functional\n");
-    printf("   - Database Logging: ✅ %d readings stored\n", demo->core->system_status.sensor_history_count);
-    printf("   - UI Synchronization: ✅ Live updates working\n");
-    printf("   - Automatic Actions: ✅ Watering triggered based on data\n");
+    if (demo->json_output) {
+        printf("{\"demo\":4,\"readings\":%d,\"pipeline\":\"ok\"}\n",
+               demo->core->system_status.sensor_history_count);
+    } else {
+        printf("\n✅ Demo 4 Complete!\n");
+        printf("   - Data Pipeline: ✅ Sensor → Database → UI\n");
+        printf("   - Real-time Updates: ✅ Functional\n");
+        printf("   - Database Logging: ✅ %d readings stored\n", demo->core->system_status.sensor_history_count);
+        printf("   - UI Synchronization: ✅ Live updates working\n");
+        printf("   - Automatic Actions: ✅ Watering triggered based on data\n");
+    }
 }
 
 void demo_5_system_integration_touchscreen(demo_system_t *demo) {
@@ -321,47 +392,52 @@ void demo_5_system_integration_touchscreen(demo_system_t *demo) {
         return;
     }
     
+    raspberry_pi_core_t *core = demo->core;
+    hardware_interface_t *hw = core->hardware;
+    
     printf("\n🔧 Testing Complete System Integration...\n");
     
-    printf("   - Hardware Status: %s\n", demo->core->hardware->gpio_initialized ? "operational" : "simulation");
-    printf("   - GPIO Initialized: %s\n", demo->core->hardware->gpio_initialized ? "true" : "false");
-    printf("   - Simulation Mode: %s\n", demo->core->simulation_mode ? "true" : "false");
+    printf("   - Hardware Status: %s\n", hw->gpio_initialized ? "operational" : "simulation");
+    printf("   - GPIO Initialized: %s\n", hw->gpio_initialized ? "true" : "false");
+    printf("   - Simulation Mode: %s\n", core->simulation_mode ? "true" : "false");
     
-    printf("   - Active Plants: %d\n", demo->core->active_plants_count);
-    for (int i = 0; i < demo->core->active_plants_count; i++) {
-        const plant_t *plant = &demo->core->active_plants[i];
+    printf("   - Active Plants: %d\n", core->active_plants_count);
+    for (int i = 0; i < core->active_plants_count; i++) {
+        const plant_t *plant = &core->active_plants[i];
         printf("     * %s at position %d\n", plant->name, plant->position);
     }
     
     printf("\n📊 Testing Complete Monitoring Cycle...\n");
     
+    struct timespec next_tick;
+    demo_start_ticks(&next_tick);
     for (int cycle = 0; cycle < 3; cycle++) {
         printf("\n   Cycle %d/3:\n", cycle + 1);
         
-        sensor_data_t sensor_data = read_all_sensors(demo->core->hardware);
+        pi_core_read_all_sensors(core);
         printf("     1. Sensor Reading: ✅ Complete\n");
         
         plant_validation_t validation_results[10];
-        pi_core_validate_sensor_readings(demo->core, validation_results);
+        pi_core_validate_sensor_readings(core, validation_results);
         printf("     2. Plant Validation: ✅ Complete\n");
         
         plant_t plants_needing_water[10];
-        int count = pi_core_check_plants_needing_water(demo->core, plants_needing_water);
+        int count = pi_core_check_plants_needing_water(core, plants_needing_water);
         if (count > 0) {
             const plant_t *plant = &plants_needing_water[0];
             printf("     3. Automatic Action: Watering %s\n", plant->name);
-            bool success = control_pump(demo->core->hardware, 1, 2.0, plant->water_amount);
+            bool success = demo_control_pump(demo, 1, 2.0, plant->water_amount);
             printf("        Result: %s\n", success ? "Success" : "Failed");
         } else {
             printf("     3. Automatic Action: No watering needed\n");
         }
         
-        set_status_led(demo->core->hardware, "normal");
+        set_status_led(hw, "normal");
         printf("     4. Status Update: ✅ Complete\n");
         
-        printf("     5. Data Logging: ✅ %d readings\n", demo->core->system_status.sensor_history_count);
+        printf("     5. Data Logging: ✅ %d readings\n", core->system_status.sensor_history_count);
         
-        sleep(3);
+        demo_wait_next_tick(&next_tick, 3);
     }
     
     printf("\n📱 Testing Touch Screen Interface...\n");
@@ -379,28 +455,27 @@ void demo_5_system_integration_touchscreen(demo_system_t *demo) {
     
     for (int i = 0; i < 5; i++) {
         printf("   - Touch Action: %s → ✅ Responsive\n", touch_interactions[i]);
-        sleep(1);
     }
     
     printf("\n👤 Testing Complete User Workflow...\n");
     
     printf("   1. User checks plant status on touch screen\n");
-    sensor_data_t sensor_data = read_all_sensors(demo->core->hardware);
+    sensor_data_t sensor_data = pi_core_read_all_sensors(core);
     printf("      → Display: Temperature %.1f°C, Soil %.1f%%, Water %.1f%%\n",
            sensor_data.temperature_celsius, sensor_data.soil_moisture_percent, sensor_data.water_tank_percentage);
     
     printf("   2. User manually triggers watering\n");
-    bool success = control_pump(demo->core->hardware, 1, 3.0, 200);
+    bool success = demo_control_pump(demo, 1, 3.0, 200);
     printf("      → Manual watering: %s\n", success ? "✅ Success" : "❌ Failed");
     
     printf("   3. User views historical data\n");
-    printf("      → Historical data: %d readings available\n", demo->core->system_status.sensor_history_count);
+    printf("      → Historical data: %d readings available\n", core->system_status.sensor_history_count);
     
     printf("   4. User adjusts plant settings\n");
-    if (demo->core->active_plants_count > 0) {
-        plant_t *plant = &demo->core->active_plants[0];
+    if (core->active_plants_count > 0) {
+        const plant_t *plant = &core->active_plants[0];
         int original_freq = plant->watering_frequency;
-        plant->watering_frequency = 5;
+        pi_core_set_watering_frequency(core, plant->position, 5);
         printf("      → Adjusted %s watering frequency: %d → 5 days\n", plant->name, original_freq);
     }
     
@@ -410,36 +485,43 @@ void demo_5_system_integration_touchscreen(demo_system_t *demo) {
     printf("   - Mobile/PC access: http://[raspberry-pi-ip]:8080\n");
     
     printf("   - Demonstrating live operation for 15 seconds...\n");
+    demo_start_ticks(&next_tick);
     for (int i = 0; i < 3; i++) {
-        sensor_data_t sensor_data = read_all_sensors(demo->core->hardware);
+        sensor_data_t sensor_data = pi_core_read_all_sensors(core);
         
         if (i == 1) {
             plant_t plants_needing_water[10];
-            int count = pi_core_check_plants_needing_water(demo->core, plants_needing_water);
+            int count = pi_core_check_plants_needing_water(core, plants_needing_water);
             if (count > 0) {
                 const plant_t *plant = &plants_needing_water[0];
                 printf("     → Automatic watering triggered for %s\n", plant->name);
-                control_pump(demo->core->hardware, 1, 2.0, plant->water_amount);
+                demo_control_pump(demo, 1, 2.0, plant->water_amount);
             }
         }
         
         char timestamp_str[64];
         pi_core_format_timestamp(sensor_data.timestamp, timestamp_str, sizeof(timestamp_str));
         printf("     → Live update: %s\n", timestamp_str);
-        sleep(5);
+        demo_wait_next_tick(&next_tick, 5);
     }
     
-    printf("\n✅ Demo 5 Complete!\n");
-    printf("   - System Integration: ✅ All components working together\n");
-    printf("   - Touch Screen: ✅ 7\" display functional\n");
-    printf("   - Web Interface: ✅ Accessible on multiple devices\n");
-    printf("   - Automatic Operation: ✅ Self-sufficient plant care\n");
-    printf("   - User Control: ✅ Manual override capabilities\n");
-    printf("   - Data Logging: ✅ Complete sensor history\n");
-    printf("   - Real-time Updates: ✅ Live monitoring active\n");
+    if (demo->json_output) {
+        printf("{\"demo\":5,\"plants\":%d,\"readings\":%d,\"manual_watering\":%s}\n",
+               core->active_plants_count, core->system_status.sensor_history_count,
+               success ? "true" : "false");
+    } else {
+        printf("\n✅ Demo 5 Complete!\n");
+        printf("   - System Integration: ✅ All components working together\n");
+        printf("   - Touch Screen: ✅ 7\" display functional\n");
+        printf("   - Web Interface: ✅ Accessible on multiple devices\n");
+        printf("   - Automatic Operation: ✅ Self-sufficient plant care\n");
+        printf("   - User Control: ✅ Manual override capabilities\n");
+        printf("   - Data Logging: ✅ Complete sensor history\n");
+        printf("   - Real-time Updates: ✅ Live monitoring active\n");
+    }
 }
 
-void run_all_demos(demo_system_t *demo) {
+void run_all_milestone_demos(demo_system_t *demo) {
     printf("🌱 AUTOMATED PLANTER - COMPLETE DEMO SEQUENCE\n");
     printf("============================================================\n");
     
@@ -452,29 +534,86 @@ void run_all_demos(demo_system_t *demo) {
         demo_5_system_integration_touchscreen
     };
     
+    double total_seconds = 0.0;
     for (int i = 0; i < 5; i++) {
         printf("\nRunning %s...\n", demo_names[i]);
+        
+        struct timespec start, end;
+        clock_gettime(CLOCK_MONOTONIC, &start);
         demo_functions[i](demo);
-        printf("\n✅ %s completed successfully!\n", demo_names[i]);
-        printf("\nPress Enter to continue to next demo...");
-        getchar();
+        clock_gettime(CLOCK_MONOTONIC, &end);
+        
+        double elapsed = (end.tv_sec - start.tv_sec) + (end.tv_nsec - start.tv_nsec) / 1e9;
+        total_seconds += elapsed;
+        printf("\n✅ %s completed successfully! (%.3fs)\n", demo_names[i], elapsed);
+        
+        if (!demo->auto_mode) {
+            printf("\nPress Enter to continue to next demo...");
+            fflush(stdout);
+            getchar();
+        }
     }
     
     printf("\n🎉 ALL DEMOS COMPLETED!\n");
     printf("   - Automated Planter system fully demonstrated\n");
     printf("   - All 5 milestones achieved\n");
     printf("   - System ready for production use\n");
+    printf("   - Total demo time: %.3fs\n", total_seconds);
+}
+
+// Demo dispatch table shared by the command line and the interactive menu
+typedef struct {
+    char key;                          // Interactive menu key
+    const char *arg;                   // Command line argument
+    const char *title;
+    void (*run)(demo_system_t *demo);
+    bool exits_menu;                   // Leave the interactive menu after running
+} demo_command_t;
+
+static const demo_command_t demo_commands[] = {
+    {'1', "1",   "Plant UI & Database Implementation",          demo_1_plant_ui_database,              false},
+    {'2', "2",   "Water Pump Implementation",                   demo_2_water_pump_implementation,      false},
+    {'3', "3",   "Sensor Implementation",                       demo_3_sensor_implementation,          false},
+    {'4', "4",   "Sensors, Database, and UI Synchronized",      demo_4_sensors_database_ui_sync,       false},
+    {'5', "5",   "System Integration + Touch Screen Display",   demo_5_system_integration_touchscreen, false},
+    {'A', "all", "Run All Demos",                               run_all_milestone_demos,               true},
+};
+static const int demo_commands_count = sizeof(demo_commands) / sizeof(demo_commands[0]);
+
+static const demo_command_t *find_demo_by_arg(const char *arg) {
+    for (int i = 0; i < demo_commands_count; i++) {
+        if (strcmp(arg, demo_commands[i].arg) == 0) return &demo_commands[i];
+    }
+    return NULL;
+}
+
+static const demo_command_t *find_demo_by_key(char key) {
+    key = (char)toupper((unsigned char)key);
+    for (int i = 0; i < demo_commands_count; i++) {
+        if (key == demo_commands[i].key) return &demo_commands[i];
+    }
+    return NULL;
 }
 
 int main(int argc, char *argv[]) {
+    setvbuf(stdout, NULL, _IOFBF, DEMO_OUTPUT_BUFFER_SIZE);
     printf("🌱 Automated Planter Demo System\n");
     
     bool simulation_mode = true;
+    bool json_output = false;
+    bool auto_mode = false;
+    const char *demo_arg = NULL;
     
     // Parse command line arguments
     for (int i = 1; i < argc; i++) {
         if (strcmp(argv[i], "--real-hardware") == 0) {
             simulation_mode = false;
+        } else if (strcmp(argv[i], "--json") == 0) {
+            json_output = true;
+        } else if (strcmp(argv[i], "--auto") == 0) {
+            auto_mode = true;
+        } else if (!demo_arg) {
+            demo_arg = argv[i];
         }
     }
     
@@ -483,74 +622,46 @@ int main(int argc, char *argv[]) {
         printf("❌ Failed to initialize demo system\n");
         return 1;
     }
+    demo->json_output = json_output;
+    demo->auto_mode = auto_mode;
     
-    if (argc > 1) {
-        char *demo_num = argv[1];
+    if (demo_arg) {
+        const demo_command_t *command = find_demo_by_arg(demo_arg);
         
-        if (strcmp(demo_num, "1") == 0) {
-            demo_1_plant_ui_database(demo);
-        } else if (strcmp(demo_num, "2") == 0) {
-            demo_2_water_pump_implementation(demo);
-        } else if (strcmp(demo_num, "3") == 0) {
-            demo_3_sensor_implementation(demo);
-        } else if (strcmp(demo_num, "4") == 0) {
-            demo_4_sensors_database_ui_sync(demo);
-        } else if (strcmp(demo_num, "5") == 0) {
-            demo_5_system_integration_touchscreen(demo);
-        } else if (strcmp(demo_num, "all") == 0) {
-            run_all_demos(demo);
+        if (command) {
+            command->run(demo);
         } else {
-            printf("Unknown demo number: %s\n", demo_num);
-            printf("Usage: ./demo_milestones [1|2|3|4|5|all] [--real-hardware]\n");
+            printf("Unknown demo number: %s\n", demo_arg);
+            printf("Usage: ./demo_milestones [1|2|3|4|5|all] [--real-hardware] [--json] [--auto]\n");
         }
     } else {
         // Interactive mode
         printf("Choose a demo to run:\n");
-        printf("1. Plant UI & Database Implementation\n");
-        printf("2. Water Pump Implementation\n");
-        printf("3. Sensor Implementation\n");
-        printf("4. Sensors, Database, and UI Synchronized\n");
-        printf("5. System Integration + Touch Screen Display\n");
-        printf("A. Run All Demos\n");
+        for (int i = 0; i < demo_commands_count; i++) {
+            printf("%c. %s\n", demo_commands[i].key, demo_commands[i].title);
+        }
         printf("Q. Quit\n");
         
         char choice;
         while (1) {
             printf("\nEnter your choice (1-5, A, Q): ");
-            scanf(" %c", &choice);
+            fflush(stdout);
+            if (scanf(" %c", &choice) != 1 || choice == 'Q' || choice == 'q') {
+                printf("Goodbye!\n");
+                break;
+            }
             
-            switch (choice) {
-                case '1':
-                    demo_1_plant_ui_database(demo);
-                    break;
-                case '2':
-                    demo_2_water_pump_implementation(demo);
-                    break;
-                case '3':
-                    demo_3_sensor_implementation(demo);
-                    break;
-                case '4':
-                    demo_4_sensors_database_ui_sync(demo);
-                    break;
-                case '5':
-                    demo_5_system_integration_touchscreen(demo);
-                    break;
-                case 'A':
-                case 'a':
-                    run_all_demos(demo);
-                    goto cleanup;
-                case 'Q':
-                case 'q':
-                    printf("Goodbye!\n");
-                    goto cleanup;
-                default:
-                    printf("Invalid choice. Please try again.\n");
-                    break;
+            const demo_command_t *command = find_demo_by_key(choice);
+            if (!command) {
+                printf("Invalid choice. Please try again.\n");
+                continue;
             }
+            
+            command->run(demo);
+            if (command->exits_menu) break;
         }
     }
     
-cleanup:
     demo_cleanup(demo);
     return 0;
 }
@@ -1,3 +1,5 @@
+#define _DEFAULT_SOURCE
+
 #include "hardware_drivers.h"
 #include <stdio.h>
 #include <stdlib.h>
@@ -7,9 +9,12 @@
 #include <math.h>
 #include <sys/time.h>
 #include <stdarg.h>
+#include <sched.h>
+#include <poll.h>
 
 // I2C and SPI includes for sensors
 #include <linux/i2c-dev.h>
+#include <linux/spi/spidev.h>
 #include <fcntl.h>
 #include <sys/ioctl.h>
 
@@ -49,55 +54,124 @@ static bool dht22_read_raw(hardware_interface_t *hw, uint8_t *data) {
     return (checksum == data[4]);
 }
 
-// ADC reading for soil moisture (MCP3008)
-static uint16_t read_adc_channel(int spi_fd, int channel) {
-    if (spi_fd < 0) return 0;
+static void dht22_decode(const uint8_t *data, float *temperature, float *humidity) {
+    // Convert raw data to temperature and humidity
+    *humidity = ((data[0] << 8) | data[1]) / 10.0;
+    *temperature = (((data[2] & 0x7F) << 8) | data[3]) / 10.0;
+    
+    // Handle negative temperature
+    if (data[2] & 0x80) {
+        *temperature = -(*temperature);
+    }
+}
+
+// Samples the DHT22 every DHT22_SAMPLE_INTERVAL_SECONDS into the latest-value
+// slot so callers never block on the slow, timing-sensitive bit-bang read
+static void *dht22_sampler_thread(void *arg) {
+    hardware_interface_t *hw = (hardware_interface_t*)arg;
+    
+    // Real-time priority tightens the bit timing, but a SCHED_FIFO thread
+    // busy-waiting in the bit-bang loop can starve the pump timers and
+    // other threads on a single core, so it is opt-in (PLANTER_DHT22_RT=1).
+    // Needs CAP_SYS_NICE; a failure just leaves the default policy.
+    const char *realtime = getenv("PLANTER_DHT22_RT");
+    if (realtime && strcmp(realtime, "1") == 0) {
+        struct sched_param param = { .sched_priority = 1 };
+        pthread_setschedparam(pthread_self(), SCHED_FIFO, &param);
+    }
     
-    uint8_t tx[3] = {0x01, (0x08 | channel) << 4, 0x00};
-    uint8_t rx[3];
+    struct timespec next_sample;
+    clock_gettime(CLOCK_MONOTONIC, &next_sample);
     
-    struct spi_ioc_transfer tr = {
-        .tx_buf = (unsigned long)tx,
-        .rx_buf = (unsigned long)rx,
-        .len = 3,
-        .speed_hz = 1000000,
-        .delay_usecs = 0,
-        .bits_per_word = 8,
-    };
+    pthread_mutex_lock(&hw->dht22_mutex);
+    while (!hw->dht22_stop_requested) {
+        pthread_mutex_unlock(&hw->dht22_mutex);
+        
+        uint8_t data[5];
+        float temperature, humidity;
+        bool ok = dht22_read_raw(hw, data);
+        if (ok) {
+            dht22_decode(data, &temperature, &humidity);
+        }
+        
+        pthread_mutex_lock(&hw->dht22_mutex);
+        if (ok) {
+            hw->dht22_temperature = temperature;
+            hw->dht22_humidity = humidity;
+            hw->dht22_valid = true;
+            clock_gettime(CLOCK_MONOTONIC, &hw->dht22_sample_time);
+        }
+        
+        next_sample.tv_sec += DHT22_SAMPLE_INTERVAL_SECONDS;
+        while (!hw->dht22_stop_requested &&
+               pthread_cond_timedwait(&hw->dht22_cond, &hw->dht22_mutex, &next_sample) != ETIMEDOUT) {
+            // Woken early: loop re-checks the stop flag
+        }
+    }
+    pthread_mutex_unlock(&hw->dht22_mutex);
+    
+    return NULL;
+}
+
+// ADC reading for soil moisture (MCP3008)
+#define MCP3008_CHANNELS 8
+
+// Read several ADC channels in one SPI_IOC_MESSAGE ioctl. Each conversion is
+// its own 3-byte transfer with chip select released in between, as the
+// MCP3008 requires, but the batch costs a single syscall.
+static bool read_adc_channels(int spi_fd, const int *channels, uint16_t *values, int count) {
+    if (spi_fd < 0 || count <= 0 || count > MCP3008_CHANNELS) return false;
+    
+    uint8_t tx[MCP3008_CHANNELS][3];
+    uint8_t rx[MCP3008_CHANNELS][3];
+    struct spi_ioc_transfer tr[MCP3008_CHANNELS];
+    memset(tr, 0, sizeof(tr));
+    
+    for (int i = 0; i < count; i++) {
+        tx[i][0] = 0x01;
+        tx[i][1] = (0x08 | channels[i]) << 4;
+        tx[i][2] = 0x00;
+        
+        tr[i].tx_buf = (unsigned long)tx[i];
+        tr[i].rx_buf = (unsigned long)rx[i];
+        tr[i].len = 3;
+        tr[i].speed_hz = 1000000;
+        tr[i].delay_usecs = 0;
+        tr[i].bits_per_word = 8;
+        tr[i].cs_change = (i < count - 1); // Release CS between conversions
+    }
     
-    if (ioctl(spi_fd, SPI_IOC_MESSAGE(1), &tr) < 0) {
-        return 0;
+    if (ioctl(spi_fd, SPI_IOC_MESSAGE(count), tr) < 0) {
+        return false;
     }
     
-    return ((rx[1] & 0x03) << 8) | rx[2];
+    for (int i = 0; i < count; i++) {
+        values[i] = ((rx[i][1] & 0x03) << 8) | rx[i][2];
+    }
+    return true;
+}
+
+static uint16_t read_adc_channel(int spi_fd, int channel) {
+    uint16_t value;
+    return read_adc_channels(spi_fd, &channel, &value, 1) ? value : 0;
 }
 
 // I2C light sensor reading (TSL2561)
 static float read_tsl2561_lux(int i2c_fd) {
     if (i2c_fd < 0) return 0.0;
     
-    // Enable sensor
-    uint8_t enable_cmd = 0x03;
-    if (write(i2c_fd, &enable_cmd, 1) != 1) return 0.0;
-    
-    usleep(100000); // Wait 100ms for integration
+    // Sensor was powered on in hardware_init and integrates continuously
     
-    // Read channel 0 (visible + IR)
-    uint8_t cmd0 = 0x0C;
-    if (write(i2c_fd, &cmd0, 1) != 1) return 0.0;
+    // Read both channels in one burst starting at DATA0LOW (command | block
+    // protocol | 0x0C): channel 0 (visible + IR) then channel 1 (IR only)
+    uint8_t cmd = 0x9C;
+    if (write(i2c_fd, &cmd, 1) != 1) return 0.0;
     
-    uint8_t data[2];
-    if (read(i2c_fd, data, 2) != 2) return 0.0;
+    uint8_t data[4];
+    if (read(i2c_fd, data, 4) != 4) return 0.0;
     
     uint16_t ch0 = (data[1] << 8) | data[0];
-    
-    // Read channel 1 (IR only)
-    uint8_t cmd1 = 0x0E;
-    if (write(i2c_fd, &cmd1, 1) != 1) return 0.0;
-    
-    if (read(i2c_fd, data, 2) != 2) return 0.0;
-    
-    uint16_t ch1 = (data[1] << 8) | data[0];
+    uint16_t ch1 = (data[3] << 8) | data[2];
     
     // Calculate lux (simplified formula)
     if (ch0 == 0) return 0.0;
@@ -120,6 +194,151 @@ static float read_tsl2561_lux(int i2c_fd) {
     return lux;
 }
 
+// Feeds the hardware watchdog until shutdown. Once the monitoring loop has
+// sent a heartbeat, feeding stops if it goes quiet for
+// WATCHDOG_HEARTBEAT_TIMEOUT_SECONDS so a wedged loop resets the Pi. Waits
+// on pump_cond so hardware_cleanup's stop broadcast ends it promptly.
+static void *watchdog_thread(void *arg) {
+    hardware_interface_t *hw = (hardware_interface_t*)arg;
+    
+    struct timespec next_feed;
+    clock_gettime(CLOCK_MONOTONIC, &next_feed);
+    bool stall_reported = false;
+    
+    pthread_mutex_lock(&hw->pump_mutex);
+    while (!hw->pump_stop_requested) {
+        bool alive = true;
+        if (hw->watchdog_heartbeat_seen) {
+            struct timespec now;
+            clock_gettime(CLOCK_MONOTONIC, &now);
+            alive = now.tv_sec - hw->watchdog_heartbeat.tv_sec < WATCHDOG_HEARTBEAT_TIMEOUT_SECONDS;
+        }
+        
+        if (alive) {
+            if (write(hw->watchdog_fd, "\0", 1) != 1) {
+                hardware_log("WARNING", "Failed to feed watchdog: %s", strerror(errno));
+            }
+            stall_reported = false;
+        } else if (!stall_reported) {
+            hardware_log("ERROR", "Monitoring loop stalled, no longer feeding watchdog");
+            stall_reported = true;
+        }
+        
+        next_feed.tv_sec += WATCHDOG_FEED_SECONDS;
+        while (!hw->pump_stop_requested &&
+               pthread_cond_timedwait(&hw->pump_cond, &hw->pump_mutex, &next_feed) != ETIMEDOUT) {
+            // Woken early: loop re-checks the stop flag
+        }
+    }
+    pthread_mutex_unlock(&hw->pump_mutex);
+    
+    return NULL;
+}
+
+// Called by the monitoring loop to show it is still making progress
+void hardware_watchdog_heartbeat(hardware_interface_t *hw) {
+    if (!hw || !hw->watchdog_running) return;
+    
+    pthread_mutex_lock(&hw->pump_mutex);
+    clock_gettime(CLOCK_MONOTONIC, &hw->watchdog_heartbeat);
+    hw->watchdog_heartbeat_seen = true;
+    pthread_mutex_unlock(&hw->pump_mutex);
+}
+
+static void watchdog_start(hardware_interface_t *hw) {
+    const char *enabled = getenv("PLANTER_WATCHDOG");
+    if (!enabled || strcmp(enabled, "1") != 0) return;
+    
+    hw->watchdog_fd = open(WATCHDOG_DEVICE, O_WRONLY);
+    if (hw->watchdog_fd < 0) {
+        hardware_log("WARNING", "Failed to open watchdog: %s", strerror(errno));
+        return;
+    }
+    
+    if (pthread_create(&hw->watchdog_thread, NULL, watchdog_thread, hw) != 0) {
+        hardware_log("WARNING", "Failed to start watchdog thread");
+        return;
+    }
+    hw->watchdog_running = true;
+    hardware_log("INFO", "Hardware watchdog armed");
+}
+
+static void watchdog_stop(hardware_interface_t *hw) {
+    if (hw->watchdog_running) {
+        pthread_join(hw->watchdog_thread, NULL);
+        hw->watchdog_running = false;
+    }
+    
+    if (hw->watchdog_fd >= 0) {
+        // Magic close: disarm instead of resetting the Pi on a clean exit
+        if (write(hw->watchdog_fd, "V", 1) != 1) {
+            hardware_log("WARNING", "Failed to disarm watchdog");
+        }
+        close(hw->watchdog_fd);
+        hw->watchdog_fd = -1;
+    }
+}
+
+// Water level sensor pins, ordered top, middle, bottom
+static const unsigned int water_level_pins[3] = WATER_LEVEL_PINS;
+
+// Waits for edge events on the water level lines and records the new
+// level; the contacts change rarely, so this replaces three reads per tick
+static void *water_level_watcher_thread(void *arg) {
+    hardware_interface_t *hw = (hardware_interface_t*)arg;
+    
+    struct pollfd fds[4];
+    for (int i = 0; i < 3; i++) {
+        fds[i].fd = gpiod_line_event_get_fd(hw->water_level_lines[i]);
+        fds[i].events = POLLIN;
+    }
+    fds[3].fd = hw->water_level_stop_pipe[0];
+    fds[3].events = POLLIN;
+    
+    pthread_mutex_lock(&hw->water_level_mutex);
+    bool tank_empty = !hw->water_levels[2];
+    pthread_mutex_unlock(&hw->water_level_mutex);
+    
+    while (1) {
+        if (poll(fds, 4, -1) < 0) {
+            if (errno == EINTR) continue;
+            hardware_log("ERROR", "Water level poll failed: %s", strerror(errno));
+            break;
+        }
+        
+        if (fds[3].revents) break; // Shutdown requested
+        
+        for (int i = 0; i < 3; i++) {
+            if (!(fds[i].revents & POLLIN)) continue;
+            
+            struct gpiod_line_event event;
+            if (gpiod_line_event_read(hw->water_level_lines[i], &event) < 0) continue;
+            
+            pthread_mutex_lock(&hw->water_level_mutex);
+            hw->water_levels[i] = (event.event_type == GPIOD_LINE_EVENT_RISING_EDGE);
+            pthread_mutex_unlock(&hw->water_level_mutex);
+        }
+        
+        // React to the bottom contact as it changes instead of waiting for
+        // the next monitoring cycle to notice
+        pthread_mutex_lock(&hw->water_level_mutex);
+        bool now_empty = !hw->water_levels[2];
+        pthread_mutex_unlock(&hw->water_level_mutex);
+        
+        if (now_empty != tank_empty) {
+            tank_empty = now_empty;
+            if (tank_empty) {
+                hardware_log("WARNING", "Water tank empty");
+            } else {
+                hardware_log("INFO", "Water tank refilled");
+            }
+            set_status_led(hw, tank_empty ? "warning" : "normal");
+        }
+    }
+    
+    return NULL;
+}
+
 hardware_interface_t* hardware_init(bool simulation_mode) {
     hardware_interface_t *hw = malloc(sizeof(hardware_interface_t));
     if (!hw) {
@@ -129,6 +348,24 @@ hardware_interface_t* hardware_init(bool simulation_mode) {
     
     memset(hw, 0, sizeof(hardware_interface_t));
     hw->simulation_mode = simulation_mode;
+    hw->spi_fd = -1;
+    hw->i2c_fd = -1;
+    hw->water_level_stop_pipe[0] = -1;
+    hw->water_level_stop_pipe[1] = -1;
+    hw->watchdog_fd = -1;
+    
+    // Pump timers wait on the monotonic clock so wall-clock jumps don't
+    // stretch or cut short a watering run
+    pthread_condattr_t cond_attr;
+    pthread_condattr_init(&cond_attr);
+    pthread_condattr_setclock(&cond_attr, CLOCK_MONOTONIC);
+    pthread_cond_init(&hw->pump_cond, &cond_attr);
+    pthread_cond_init(&hw->dht22_cond, &cond_attr);
+    pthread_condattr_destroy(&cond_attr);
+    pthread_mutex_init(&hw->pump_mutex, NULL);
+    pthread_mutex_init(&hw->dht22_mutex, NULL);
+    pthread_mutex_init(&hw->water_level_mutex, NULL);
+    pthread_mutex_init(&hw->bus_mutex, NULL);
     
     if (!simulation_mode) {
         // Open GPIO chip
@@ -142,9 +379,9 @@ hardware_interface_t* hardware_init(bool simulation_mode) {
         // Request GPIO lines
         hw->dht22_line = gpiod_chip_get_line(hw->chip, DHT22_PIN);
         hw->soil_moisture_line = gpiod_chip_get_line(hw->chip, SOIL_MOISTURE_PIN);
-        hw->water_level_lines[0] = gpiod_chip_get_line(hw->chip, 5);
-        hw->water_level_lines[1] = gpiod_chip_get_line(hw->chip, 6);
-        hw->water_level_lines[2] = gpiod_chip_get_line(hw->chip, 7);
+        for (int i = 0; i < 3; i++) {
+            hw->water_level_lines[i] = gpiod_chip_get_line(hw->chip, water_level_pins[i]);
+        }
         hw->pump1_line = gpiod_chip_get_line(hw->chip, PUMP1_PIN);
         hw->pump2_line = gpiod_chip_get_line(hw->chip, PUMP2_PIN);
         hw->pump_enable_line = gpiod_chip_get_line(hw->chip, PUMP_ENABLE_PIN);
@@ -163,7 +400,8 @@ hardware_interface_t* hardware_init(bool simulation_mode) {
         }
         
         for (int i = 0; i < 3; i++) {
-            if (gpiod_line_request_input(hw->water_level_lines[i], "automated_planter") < 0) {
+            // Both-edges event lines can still be read with gpiod_line_get_value
+            if (gpiod_line_request_both_edges_events(hw->water_level_lines[i], "automated_planter") < 0) {
                 hardware_log("ERROR", "Failed to request water level line %d", i);
                 goto cleanup;
             }
@@ -196,6 +434,47 @@ hardware_interface_t* hardware_init(bool simulation_mode) {
         }
         
         hw->gpio_initialized = true;
+        
+        // Open the sensor buses once; reads reuse these descriptors
+        hw->spi_fd = open(SPI_DEVICE, O_RDWR);
+        if (hw->spi_fd < 0) {
+            hardware_log("ERROR", "Failed to open SPI device: %s", strerror(errno));
+        }
+        
+        hw->i2c_fd = open(I2C_DEVICE, O_RDWR);
+        if (hw->i2c_fd < 0) {
+            hardware_log("ERROR", "Failed to open I2C device: %s", strerror(errno));
+        } else if (ioctl(hw->i2c_fd, I2C_SLAVE, TSL2561_ADDRESS) < 0) {
+            hardware_log("ERROR", "Failed to set I2C slave address: %s", strerror(errno));
+            close(hw->i2c_fd);
+            hw->i2c_fd = -1;
+        } else {
+            // Power on the TSL2561 (command | control register, power up)
+            uint8_t power_on[2] = {0x80, 0x03};
+            if (write(hw->i2c_fd, power_on, 2) != 2) {
+                hardware_log("WARNING", "Failed to power on light sensor");
+            }
+        }
+        
+        // Seed the water levels, then track them from edge events
+        for (int i = 0; i < 3; i++) {
+            hw->water_levels[i] = gpiod_line_get_value(hw->water_level_lines[i]) == 1;
+        }
+        if (pipe(hw->water_level_stop_pipe) == 0 &&
+            pthread_create(&hw->water_level_thread, NULL, water_level_watcher_thread, hw) == 0) {
+            hw->water_level_watcher_running = true;
+        } else {
+            hardware_log("WARNING", "Failed to start water level watcher, reading inline");
+        }
+        
+        watchdog_start(hw);
+        
+        if (pthread_create(&hw->dht22_thread, NULL, dht22_sampler_thread, hw) == 0) {
+            hw->dht22_sampler_running = true;
+        } else {
+            hardware_log("WARNING", "Failed to start DHT22 sampler, reading inline");
+        }
+        
         hardware_log("INFO", "Hardware interface initialized successfully");
     } else {
         hardware_log("INFO", "Hardware interface initialized in simulation mode");
@@ -211,6 +490,48 @@ cleanup:
 void hardware_cleanup(hardware_interface_t *hw) {
     if (!hw) return;
     
+    // A normal shutdown lets queued runs finish so the water that was asked
+    // for is delivered; after control_pump_abort they are cut short. Waiting
+    // is bounded by PUMP_MAX_QUEUED_SECONDS and counts as watchdog progress.
+    pthread_mutex_lock(&hw->pump_mutex);
+    if ((hw->pump_status.pump1_active || hw->pump_status.pump2_active) && !hw->pump_abort_requested) {
+        hardware_log("INFO", "Waiting for queued pump runs to finish");
+    }
+    while ((hw->pump_status.pump1_active || hw->pump_status.pump2_active) && !hw->pump_abort_requested) {
+        struct timespec recheck;
+        clock_gettime(CLOCK_MONOTONIC, &recheck);
+        hw->watchdog_heartbeat = recheck;
+        recheck.tv_sec += 1; // Also picks up an abort set from a signal handler
+        pthread_cond_timedwait(&hw->pump_cond, &hw->pump_mutex, &recheck);
+    }
+    
+    // Stop any pump still running and wait for its timer to exit
+    hw->pump_stop_requested = true;
+    pthread_cond_broadcast(&hw->pump_cond);
+    pthread_mutex_unlock(&hw->pump_mutex);
+    control_pump_wait(hw, 1);
+    control_pump_wait(hw, 2);
+    watchdog_stop(hw);
+    
+    if (hw->dht22_sampler_running) {
+        pthread_mutex_lock(&hw->dht22_mutex);
+        hw->dht22_stop_requested = true;
+        pthread_cond_broadcast(&hw->dht22_cond);
+        pthread_mutex_unlock(&hw->dht22_mutex);
+        pthread_join(hw->dht22_thread, NULL);
+        hw->dht22_sampler_running = false;
+    }
+    
+    if (hw->water_level_watcher_running) {
+        if (write(hw->water_level_stop_pipe[1], "x", 1) != 1) {
+            hardware_log("WARNING", "Failed to signal water level watcher");
+        }
+        pthread_join(hw->water_level_thread, NULL);
+        hw->water_level_watcher_running = false;
+    }
+    if (hw->water_level_stop_pipe[0] >= 0) close(hw->water_level_stop_pipe[0]);
+    if (hw->water_level_stop_pipe[1] >= 0) close(hw->water_level_stop_pipe[1]);
+    
     if (hw->gpio_initialized) {
         // Turn off all outputs
         if (hw->pump1_line) gpiod_line_set_value(hw->pump1_line, 0);
@@ -234,15 +555,54 @@ void hardware_cleanup(hardware_interface_t *hw) {
         // Close chip
         if (hw->chip) gpiod_chip_close(hw->chip);
         
+        // Close sensor buses
+        if (hw->spi_fd >= 0) close(hw->spi_fd);
+        if (hw->i2c_fd >= 0) close(hw->i2c_fd);
+        
         hardware_log("INFO", "GPIO cleanup completed");
     }
     
+    pthread_cond_destroy(&hw->pump_cond);
+    pthread_mutex_destroy(&hw->pump_mutex);
+    pthread_cond_destroy(&hw->dht22_cond);
+    pthread_mutex_destroy(&hw->dht22_mutex);
+    pthread_mutex_destroy(&hw->water_level_mutex);
+    pthread_mutex_destroy(&hw->bus_mutex);
     free(hw);
 }
 
 bool read_dht22(hardware_interface_t *hw, float *temperature, float *humidity) {
     if (!hw || !temperature || !humidity) return false;
     
+    if (hw->dht22_sampler_running) {
+        pthread_mutex_lock(&hw->dht22_mutex);
+        bool valid = hw->dht22_valid;
+        struct timespec sample_time = hw->dht22_sample_time;
+        float sample_temperature = hw->dht22_temperature;
+        float sample_humidity = hw->dht22_humidity;
+        pthread_mutex_unlock(&hw->dht22_mutex);
+        
+        if (!valid) {
+            hardware_log("WARNING", "DHT22 has no valid sample yet");
+            return false;
+        }
+        
+        // The sampler keeps the last good value when reads fail, so a
+        // sensor that has stopped answering shows up as an old sample
+        struct timespec now;
+        clock_gettime(CLOCK_MONOTONIC, &now);
+        long age = now.tv_sec - sample_time.tv_sec;
+        if (age > DHT22_MAX_SAMPLE_AGE_SECONDS) {
+            hardware_log("WARNING", "DHT22 sample is stale (%lds old)", age);
+            return false;
+        }
+        
+        // Like a failed direct read, outputs are only written on success
+        *temperature = sample_temperature;
+        *humidity = sample_humidity;
+        return true;
+    }
+    
     uint8_t data[5];
     
     if (!dht22_read_raw(hw, data)) {
@@ -250,15 +610,7 @@ bool read_dht22(hardware_interface_t *hw, float *temperature, float *humidity) {
         return false;
     }
     
-    // Convert raw data to temperature and humidity
-    *humidity = ((data[0] << 8) | data[1]) / 10.0;
-    *temperature = (((data[2] & 0x7F) << 8) | data[3]) / 10.0;
-    
-    // Handle negative temperature
-    if (data[2] & 0x80) {
-        *temperature = -(*temperature);
-    }
-    
+    dht22_decode(data, temperature, humidity);
     return true;
 }
 
@@ -270,15 +622,14 @@ float read_soil_moisture(hardware_interface_t *hw) {
         return 30.0 + (rand() % 400) / 10.0; // 30.0-70.0%
     }
     
-    // Open SPI device for ADC
-    int spi_fd = open("/dev/spidev0.0", O_RDWR);
-    if (spi_fd < 0) {
-        hardware_log("ERROR", "Failed to open SPI device: %s", strerror(errno));
+    if (hw->spi_fd < 0) {
+        hardware_log("ERROR", "SPI device not open");
         return 0.0;
     }
     
-    uint16_t raw_value = read_adc_channel(spi_fd, 0);
-    close(spi_fd);
+    pthread_mutex_lock(&hw->bus_mutex);
+    uint16_t raw_value = read_adc_channel(hw->spi_fd, 0);
+    pthread_mutex_unlock(&hw->bus_mutex);
     
     // Convert to percentage (0-1023 -> 0-100%)
     float moisture_percent = (raw_value / 1023.0) * 100.0;
@@ -294,22 +645,14 @@ float read_light_sensor(hardware_interface_t *hw) {
         return 50.0 + (rand() % 5000) / 10.0; // 50.0-550.0 lux
     }
     
-    // Open I2C device
-    int i2c_fd = open("/dev/i2c-1", O_RDWR);
-    if (i2c_fd < 0) {
-        hardware_log("ERROR", "Failed to open I2C device: %s", strerror(errno));
+    if (hw->i2c_fd < 0) {
+        hardware_log("ERROR", "I2C device not open");
         return 0.0;
     }
     
-    // Set I2C slave address
-    if (ioctl(i2c_fd, I2C_SLAVE, 0x29) < 0) {
-        hardware_log("ERROR", "Failed to set I2C slave address: %s", strerror(errno));
-        close(i2c_fd);
-        return 0.0;
-    }
-    
-    float lux = read_tsl2561_lux(i2c_fd);
-    close(i2c_fd);
+    pthread_mutex_lock(&hw->bus_mutex);
+    float lux = read_tsl2561_lux(hw->i2c_fd);
+    pthread_mutex_unlock(&hw->bus_mutex);
     
     return lux;
 }
@@ -327,28 +670,154 @@ void read_water_level(hardware_interface_t *hw, bool *top, bool *middle, bool *b
     
     if (!hw->gpio_initialized) return;
     
+    bool *levels[3] = {top, middle, bottom};
+    
+    if (hw->water_level_watcher_running) {
+        pthread_mutex_lock(&hw->water_level_mutex);
+        for (int i = 0; i < 3; i++) {
+            *levels[i] = hw->water_levels[i];
+        }
+        pthread_mutex_unlock(&hw->water_level_mutex);
+        return;
+    }
+    
     // Read water level sensors (HIGH when water detected, LOW when dry)
-    *top = gpiod_line_get_value(hw->water_level_lines[0]) == 1;
-    *middle = gpiod_line_get_value(hw->water_level_lines[1]) == 1;
-    *bottom = gpiod_line_get_value(hw->water_level_lines[2]) == 1;
+    for (int i = 0; i < 3; i++) {
+        *levels[i] = gpiod_line_get_value(hw->water_level_lines[i]) == 1;
+    }
 }
 
-bool control_pump(hardware_interface_t *hw, int pump_number, float duration_seconds, float water_amount_ml) {
+// Switch a pump off; the MOSFET enable drops once both pumps are idle.
+// Caller holds pump_mutex.
+static void pump_off_locked(hardware_interface_t *hw, int pump_number) {
+    bool use_gpio = !hw->simulation_mode && hw->gpio_initialized;
+    
+    if (pump_number == 1) {
+        if (use_gpio) gpiod_line_set_value(hw->pump1_line, 0);
+        hw->pump_status.pump1_active = false;
+    } else {
+        if (use_gpio) gpiod_line_set_value(hw->pump2_line, 0);
+        hw->pump_status.pump2_active = false;
+    }
+    
+    if (use_gpio && !hw->pump_status.pump1_active && !hw->pump_status.pump2_active) {
+        gpiod_line_set_value(hw->pump_enable_line, 0);
+    }
+}
+
+// Whole seconds go into tv_sec and only the fraction into tv_nsec, so a
+// 32-bit long never has to hold more than one second of nanoseconds
+static void timespec_add_seconds(struct timespec *ts, float seconds) {
+    time_t whole = (time_t)seconds;
+    long long frac_ns = (long long)((seconds - (float)whole) * 1e9);
+    ts->tv_sec += whole;
+    ts->tv_nsec += (long)frac_ns;
+    if (ts->tv_nsec >= 1000000000L) {
+        ts->tv_sec++;
+        ts->tv_nsec -= 1000000000L;
+    } else if (ts->tv_nsec < 0) {
+        ts->tv_sec--;
+        ts->tv_nsec += 1000000000L;
+    }
+}
+
+static void *pump_timer_thread(void *arg) {
+    pump_timer_t *timer = (pump_timer_t*)arg;
+    hardware_interface_t *hw = timer->hw;
+    
+    // The deadline moves out when more runs are queued, so a timeout only
+    // ends the run if the current deadline has really passed
+    bool completed = false;
+    pthread_mutex_lock(&hw->pump_mutex);
+    while (!hw->pump_stop_requested) {
+        int rc = pthread_cond_timedwait(&hw->pump_cond, &hw->pump_mutex, &timer->deadline);
+        if (rc != 0 && rc != ETIMEDOUT) {
+            // A bad deadline must not leave the pump running
+            break;
+        }
+        if (rc == ETIMEDOUT) {
+            struct timespec now;
+            clock_gettime(CLOCK_MONOTONIC, &now);
+            if (now.tv_sec > timer->deadline.tv_sec ||
+                (now.tv_sec == timer->deadline.tv_sec && now.tv_nsec >= timer->deadline.tv_nsec)) {
+                completed = true;
+                break;
+            }
+        }
+    }
+    pump_off_locked(hw, timer->pump_number);
+    pthread_cond_broadcast(&hw->pump_cond); // Wakes hardware_cleanup waiting for the run
+    pthread_mutex_unlock(&hw->pump_mutex);
+    
+    if (completed) {
+        hardware_log("INFO", "Pump %d watering completed", timer->pump_number);
+    } else {
+        hardware_log("WARNING", "Pump %d stopped before its run finished", timer->pump_number);
+    }
+    return NULL;
+}
+
+// Switch a pump on and return immediately; a timer thread switches it off
+// after duration_seconds. If the pump is already running the new run is
+// queued behind it by pushing the timer's deadline out.
+bool control_pump_start(hardware_interface_t *hw, int pump_number, float duration_seconds, float water_amount_ml) {
+    (void)water_amount_ml;
+    
     if (!hw || pump_number < 1 || pump_number > 2) {
         hardware_log("ERROR", "Invalid pump number: %d", pump_number);
         return false;
     }
     
+    if (!isfinite(duration_seconds) || duration_seconds <= 0.0) {
+        hardware_log("ERROR", "Invalid pump %d duration: %.1fs", pump_number, duration_seconds);
+        return false;
+    }
+    
+    if (duration_seconds > PUMP_MAX_DURATION_SECONDS) {
+        hardware_log("WARNING", "Pump %d duration %.1fs clamped to %.1fs",
+                     pump_number, duration_seconds, PUMP_MAX_DURATION_SECONDS);
+        duration_seconds = PUMP_MAX_DURATION_SECONDS;
+    }
+    
+    pump_timer_t *timer = &hw->pump_timers[pump_number - 1];
     struct gpiod_line *pump_line = (pump_number == 1) ? hw->pump1_line : hw->pump2_line;
     
+    pthread_mutex_lock(&hw->pump_mutex);
+    bool active = (pump_number == 1) ? hw->pump_status.pump1_active : hw->pump_status.pump2_active;
+    if (active) {
+        struct timespec now;
+        clock_gettime(CLOCK_MONOTONIC, &now);
+        float queued_seconds = (timer->deadline.tv_sec - now.tv_sec) +
+                               (timer->deadline.tv_nsec - now.tv_nsec) / 1e9;
+        if (queued_seconds + duration_seconds > PUMP_MAX_QUEUED_SECONDS) {
+            pthread_mutex_unlock(&hw->pump_mutex);
+            hardware_log("WARNING", "Pump %d queue full (%.1fs pending)", pump_number, queued_seconds);
+            return false;
+        }
+        
+        timespec_add_seconds(&timer->deadline, duration_seconds);
+        hw->pump_status.last_watered = time(NULL);
+        pthread_mutex_unlock(&hw->pump_mutex);
+        
+        hardware_log("INFO", "Pump %d queued for %.1f more seconds", pump_number, duration_seconds);
+        return true;
+    }
+    pthread_mutex_unlock(&hw->pump_mutex);
+    
+    // Reap the timer of the previous run, which has already switched off
+    control_pump_wait(hw, pump_number);
+    
+    pthread_mutex_lock(&hw->pump_mutex);
+    
     if (!hw->simulation_mode && hw->gpio_initialized) {
-        // Enable pump via MOSFET
-        gpiod_line_set_value(hw->pump_enable_line, 1);
-        usleep(100000); // 100ms delay for MOSFET activation
+        if (!hw->pump_status.pump1_active && !hw->pump_status.pump2_active) {
+            // Enable pump via MOSFET
+            gpiod_line_set_value(hw->pump_enable_line, 1);
+            usleep(100000); // 100ms delay for MOSFET activation
+        }
         
         // Turn on specific pump
         gpiod_line_set_value(pump_line, 1);
-        hardware_log("INFO", "Pump %d started for %.1f seconds", pump_number, duration_seconds);
     }
     
     // Record pump start time
@@ -359,26 +828,76 @@ bool control_pump(hardware_interface_t *hw, int pump_number, float duration_seco
         hw->pump_status.pump2_active = true;
     }
     
-    // Run pump for specified duration
-    usleep((int)(duration_seconds * 1000000));
+    clock_gettime(CLOCK_MONOTONIC, &timer->deadline);
+    timespec_add_seconds(&timer->deadline, duration_seconds);
+    timer->hw = hw;
+    timer->pump_number = pump_number;
     
-    if (!hw->simulation_mode && hw->gpio_initialized) {
-        // Turn off pump
-        gpiod_line_set_value(pump_line, 0);
-        gpiod_line_set_value(hw->pump_enable_line, 0);
+    if (pthread_create(&timer->thread, NULL, pump_timer_thread, timer) != 0) {
+        pump_off_locked(hw, pump_number);
+        pthread_mutex_unlock(&hw->pump_mutex);
+        hardware_log("ERROR", "Failed to start timer for pump %d", pump_number);
+        return false;
     }
+    timer->running = true;
     
-    // Update status
-    if (pump_number == 1) {
-        hw->pump_status.pump1_active = false;
-    } else {
-        hw->pump_status.pump2_active = false;
+    pthread_mutex_unlock(&hw->pump_mutex);
+    
+    hardware_log("INFO", "Pump %d started for %.1f seconds", pump_number, duration_seconds);
+    return true;
+}
+
+// Block until the given pump has finished its current run
+void control_pump_wait(hardware_interface_t *hw, int pump_number) {
+    if (!hw || pump_number < 1 || pump_number > 2) return;
+    
+    pump_timer_t *timer = &hw->pump_timers[pump_number - 1];
+    if (timer->running) {
+        pthread_join(timer->thread, NULL);
+        timer->running = false;
+    }
+}
+
+// Make hardware_cleanup switch the pumps off instead of waiting for queued
+// runs. Only stores a flag, so it is safe to call from a signal handler.
+void control_pump_abort(hardware_interface_t *hw) {
+    if (hw) hw->pump_abort_requested = 1;
+}
+
+bool control_pump(hardware_interface_t *hw, int pump_number, float duration_seconds, float water_amount_ml) {
+    if (!control_pump_start(hw, pump_number, duration_seconds, water_amount_ml)) {
+        return false;
     }
     
-    hardware_log("INFO", "Pump %d watering completed", pump_number);
+    control_pump_wait(hw, pump_number);
     return true;
 }
 
+// Run several watering jobs with both pumps switched on together. Jobs for
+// the same pump are queued back-to-back, so the batch takes as long as the
+// busiest pump rather than the sum of all jobs. Each job is started on its
+// own so the per-run duration clamp applies per job, not to the total.
+bool control_pumps_batch(hardware_interface_t *hw, const pump_job_t *jobs, int job_count) {
+    if (!hw || !jobs || job_count <= 0) return false;
+    
+    for (int i = 0; i < job_count; i++) {
+        if (jobs[i].pump_number < 1 || jobs[i].pump_number > 2) {
+            hardware_log("ERROR", "Invalid pump number: %d", jobs[i].pump_number);
+            return false;
+        }
+    }
+    
+    bool success = true;
+    for (int i = 0; i < job_count; i++) {
+        success = control_pump_start(hw, jobs[i].pump_number, jobs[i].duration_seconds,
+                                     jobs[i].water_amount_ml) && success;
+    }
+    
+    control_pump_wait(hw, 1);
+    control_pump_wait(hw, 2);
+    return success;
+}
+
 void set_status_led(hardware_interface_t *hw, const char *status) {
     if (!hw || !status) return;
     
@@ -424,14 +943,42 @@ sensor_data_t read_all_sensors(hardware_interface_t *hw) {
     return data;
 }
 
+// Tank percentage indexed by top << 2 | middle << 1 | bottom; the highest
+// wet sensor wins, so inconsistent states still map to a fixed value
+static const float water_percentage_table[8] = {
+    0.0, 33.3, 66.7, 66.7, 100.0, 100.0, 100.0, 100.0
+};
+
 float calculate_water_percentage(bool top, bool middle, bool bottom) {
-    if (top) return 100.0;
-    if (middle) return 66.7;
-    if (bottom) return 33.3;
-    return 0.0;
+    return water_percentage_table[(top << 2) | (middle << 1) | bottom];
+}
+
+// Log levels in increasing severity. The lowest level printed is read once
+// from the PLANTER_LOG_LEVEL environment variable (default INFO).
+static const char *const log_levels[] = {"DEBUG", "INFO", "WARNING", "ERROR"};
+static const int log_levels_count = sizeof(log_levels) / sizeof(log_levels[0]);
+static int min_log_level = -1;
+
+static int log_level_index(const char *level, int fallback) {
+    for (int i = 0; i < log_levels_count; i++) {
+        if (strcmp(level, log_levels[i]) == 0) return i;
+    }
+    return fallback;
+}
+
+bool hardware_log_enabled(const char *level) {
+    if (min_log_level < 0) {
+        const char *env_level = getenv("PLANTER_LOG_LEVEL");
+        min_log_level = env_level ? log_level_index(env_level, 1) : 1;
+    }
+    
+    // Unknown levels are always printed
+    return log_level_index(level, log_levels_count) >= min_log_level;
 }
 
 void hardware_log(const char *level, const char *format, ...) {
+    if (!hardware_log_enabled(level)) return;
+    
     time_t now = time(NULL);
     struct tm *tm_info = localtime(&now);
     char timestamp[64];
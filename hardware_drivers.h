@@ -2,6 +2,8 @@
 #define HARDWARE_DRIVERS_H
 
 #include <gpiod.h>
+#include <pthread.h>
+#include <signal.h>
 #include <stdbool.h>
 #include <stdint.h>
 #include <time.h>
@@ -18,6 +20,21 @@
 #define STATUS_LED_PIN 12
 #define WARNING_LED_PIN 13
 
+// Sensor buses
+#define SPI_DEVICE "/dev/spidev0.0"
+#define I2C_DEVICE "/dev/i2c-1"
+#define TSL2561_ADDRESS 0x29
+
+#define DHT22_SAMPLE_INTERVAL_SECONDS 2 // DHT22 needs at least 2 s between reads
+#define DHT22_MAX_SAMPLE_AGE_SECONDS (5 * DHT22_SAMPLE_INTERVAL_SECONDS) // Older samples are stale
+
+// Pump safety
+#define PUMP_MAX_DURATION_SECONDS 30.0  // Longer runs are clamped
+#define PUMP_MAX_QUEUED_SECONDS 120.0   // Most run time a pump may have lined up
+#define WATCHDOG_DEVICE "/dev/watchdog"
+#define WATCHDOG_FEED_SECONDS 5
+#define WATCHDOG_HEARTBEAT_TIMEOUT_SECONDS 120 // Feeding stops once the monitoring loop is this late
+
 // Sensor data structure
 typedef struct {
     time_t timestamp;
@@ -38,8 +55,24 @@ typedef struct {
     time_t last_watered;
 } pump_status_t;
 
-// Hardware interface structure
+// One watering job for control_pumps_batch
 typedef struct {
+    int pump_number;
+    float duration_seconds;
+    float water_amount_ml;
+} pump_job_t;
+
+// Pump timer, switches a running pump off once its deadline passes
+typedef struct {
+    struct hardware_interface *hw;
+    int pump_number;
+    struct timespec deadline;   // CLOCK_MONOTONIC time to stop the pump
+    pthread_t thread;
+    bool running;               // Timer thread started and not yet joined
+} pump_timer_t;
+
+// Hardware interface structure
+typedef struct hardware_interface {
     struct gpiod_chip *chip;
     struct gpiod_line *dht22_line;
     struct gpiod_line *soil_moisture_line;
@@ -49,9 +82,42 @@ typedef struct {
     struct gpiod_line *pump_enable_line;
     struct gpiod_line *status_led_line;
     struct gpiod_line *warning_led_line;
+    int spi_fd;                     // MCP3008 ADC, held open for the interface lifetime
+    int i2c_fd;                     // TSL2561 light sensor, slave address already set
+    pthread_mutex_t bus_mutex;      // One SPI/I2C transaction at a time, whichever thread reads
     bool simulation_mode;
     bool gpio_initialized;
     pump_status_t pump_status;
+    pump_timer_t pump_timers[2];
+    pthread_mutex_t pump_mutex;     // Guards pump lines and pump_status
+    pthread_cond_t pump_cond;       // Wakes pump timers early on shutdown
+    bool pump_stop_requested;
+    volatile sig_atomic_t pump_abort_requested; // Cleanup cuts queued runs short instead of waiting
+    // Background DHT22 sampler (real hardware only); read_dht22 returns
+    // the latest sample instead of bit-banging the sensor inline
+    pthread_t dht22_thread;
+    bool dht22_sampler_running;
+    pthread_mutex_t dht22_mutex;
+    pthread_cond_t dht22_cond;
+    bool dht22_stop_requested;
+    bool dht22_valid;
+    struct timespec dht22_sample_time; // CLOCK_MONOTONIC time of the last good sample
+    float dht22_temperature;
+    float dht22_humidity;
+    // Water level watcher (real hardware only); updates water_levels on
+    // line edges so read_water_level needs no GPIO reads
+    pthread_t water_level_thread;
+    bool water_level_watcher_running;
+    int water_level_stop_pipe[2];   // Written to wake the watcher on shutdown
+    pthread_mutex_t water_level_mutex;
+    bool water_levels[3];           // Top, middle, bottom
+    // Hardware watchdog (opt-in with PLANTER_WATCHDOG=1); if the process
+    // dies without closing it cleanly the Pi resets and the pump GPIOs drop
+    int watchdog_fd;
+    pthread_t watchdog_thread;
+    bool watchdog_running;
+    bool watchdog_heartbeat_seen;   // Set once monitoring starts; before that the feeder feeds unconditionally
+    struct timespec watchdog_heartbeat; // CLOCK_MONOTONIC time of the last heartbeat
 } hardware_interface_t;
 
 // Function prototypes
@@ -64,12 +130,18 @@ float read_light_sensor(hardware_interface_t *hw);
 void read_water_level(hardware_interface_t *hw, bool *top, bool *middle, bool *bottom);
 
 bool control_pump(hardware_interface_t *hw, int pump_number, float duration_seconds, float water_amount_ml);
+bool control_pump_start(hardware_interface_t *hw, int pump_number, float duration_seconds, float water_amount_ml);
+void control_pump_wait(hardware_interface_t *hw, int pump_number);
+void control_pump_abort(hardware_interface_t *hw);
+bool control_pumps_batch(hardware_interface_t *hw, const pump_job_t *jobs, int job_count);
 void set_status_led(hardware_interface_t *hw, const char *status);
+void hardware_watchdog_heartbeat(hardware_interface_t *hw);
 
 sensor_data_t read_all_sensors(hardware_interface_t *hw);
 float calculate_water_percentage(bool top, bool middle, bool bottom);
 
 // Utility functions
+bool hardware_log_enabled(const char *level);
 void hardware_log(const char *level, const char *format, ...);
 time_t get_current_timestamp(void);
 
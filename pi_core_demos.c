@@ -0,0 +1,215 @@
+#define _DEFAULT_SOURCE
+
+#include "pi_core_demos.h"
+#include <stdio.h>
+#include <unistd.h>
+
+// Demo functions
+
+// Print the demo banner; false if there is no core to run against
+static bool demo_begin(raspberry_pi_core_t *core, const char *title) {
+    printf("\n============================================================\n");
+    printf("%s\n", title);
+    printf("============================================================\n");
+    
+    if (!core) {
+        printf("❌ System not initialized\n");
+        return false;
+    }
+    return true;
+}
+
+// Watering only starts or queues pump runs; wait for both pumps so the
+// demo reports results after the water has actually been delivered
+static void demo_wait_for_pumps(raspberry_pi_core_t *core) {
+    fflush(stdout);
+    control_pump_wait(core->hardware, 1);
+    control_pump_wait(core->hardware, 2);
+}
+
+void demo_1_hardware_setup(raspberry_pi_core_t *core) {
+    if (!demo_begin(core, "DEMO 1: Hardware Setup and Basic Functionality")) return;
+    
+    printf("\n🔧 System Status:\n");
+    char status_json[2048];
+    pi_core_get_system_status(core, status_json, sizeof(status_json));
+    printf("   - Hardware Mode: %s\n", core->simulation_mode ? "Simulation" : "Real Hardware");
+    printf("   - GPIO Status: %s\n", core->hardware->gpio_initialized ? "Initialized" : "Not Initialized");
+    printf("   - Active Plants: %d\n", core->active_plants_count);
+    
+    printf("\n📊 Initial Sensor Reading:\n");
+    sensor_data_t sensor_data = pi_core_read_all_sensors(core);
+    printf("   - Temperature: %.1f°C\n", sensor_data.temperature_celsius);
+    printf("   - Humidity: %.1f%%\n", sensor_data.humidity_percent);
+    printf("   - Soil Moisture: %.1f%%\n", sensor_data.soil_moisture_percent);
+    printf("   - Light: %.1f lux\n", sensor_data.light_lux);
+    printf("   - Water Level: %.1f%%\n", sensor_data.water_tank_percentage);
+    
+    printf("\n✅ Demo 1 Complete: Hardware system operational\n");
+}
+
+void demo_2_pump_control(raspberry_pi_core_t *core) {
+    if (!demo_begin(core, "DEMO 2: Water Pump Implementation")) return;
+    
+    printf("\n💧 Testing Pump Control:\n");
+    
+    // Test manual watering
+    printf("   - Manual watering test...\n");
+    bool success = pi_core_manual_water_plant(core, 0); // Water plant at position 0
+    demo_wait_for_pumps(core);
+    printf("   - Result: %s\n", success ? "✅ Success" : "❌ Failed");
+    
+    // Test automatic watering
+    printf("\n🤖 Testing Automatic Watering:\n");
+    pi_core_auto_water_plants(core);
+    demo_wait_for_pumps(core);
+    
+    printf("\n✅ Demo 2 Complete: Pump control functional\n");
+}
+
+void demo_3_sensor_integration(raspberry_pi_core_t *core) {
+    if (!demo_begin(core, "DEMO 3: Sensor Implementation")) return;
+    
+    printf("\n📊 Testing All Sensors:\n");
+    
+    // Read all sensors multiple times
+    for (int i = 0; i < 3; i++) {
+        printf("\n   Reading %d/3:\n", i + 1);
+        sensor_data_t sensor_data = pi_core_read_all_sensors(core);
+        printf("      - Temperature: %.1f°C\n", sensor_data.temperature_celsius);
+        printf("      - Humidity: %.1f%%\n", sensor_data.humidity_percent);
+        printf("      - Soil Moisture: %.1f%%\n", sensor_data.soil_moisture_percent);
+        printf("      - Light: %.1f lux\n", sensor_data.light_lux);
+        printf("      - Water Level: %.1f%%\n", sensor_data.water_tank_percentage);
+        sleep(2);
+    }
+    
+    // Test validation
+    printf("\n🔍 Testing Sensor Validation:\n");
+    plant_validation_t validation_results[10];
+    pi_core_validate_sensor_readings(core, validation_results);
+    for (int i = 0; i < core->active_plants_count; i++) {
+        bool all_ok = pi_core_validation_ok(&validation_results[i]);
+        printf("   - %s: All sensors %s\n", core->active_plants[i].name, 
+               all_ok ? "✅ OK" : "⚠️ Check needed");
+    }
+    
+    printf("\n✅ Demo 3 Complete: All sensors operational\n");
+}
+
+void demo_4_data_integration(raspberry_pi_core_t *core) {
+    if (!demo_begin(core, "DEMO 4: Data Integration and Monitoring")) return;
+    
+    printf("\n📈 Testing Data Integration:\n");
+    printf("   - Running monitoring loop for 30 seconds...\n");
+    
+    time_t start_time = time(NULL);
+    while (time(NULL) - start_time < 30) {
+        sensor_data_t sensor_data = pi_core_read_all_sensors(core);
+        plant_validation_t validation_results[10];
+        pi_core_validate_sensor_readings(core, validation_results);
+        plant_t plants_needing_water[10];
+        int count = pi_core_check_plants_needing_water(core, plants_needing_water);
+        
+        char timestamp_str[64];
+        pi_core_format_timestamp(sensor_data.timestamp, timestamp_str, sizeof(timestamp_str));
+        printf("      → %s: Temp=%.1f°C, Plants needing water: %d\n",
+               timestamp_str, sensor_data.temperature_celsius, count);
+        
+        sleep(5);
+    }
+    
+    sensor_data_t mean, stddev;
+    int averaged = pi_core_sensor_history_stats(core, 0, &mean, &stddev);
+    if (averaged > 0) {
+        printf("\n📊 Average of last %d readings: Temp=%.1f°C, Humidity=%.1f%%, Soil=%.1f%%, Light=%.1f lux\n",
+               averaged, mean.temperature_celsius, mean.humidity_percent,
+               mean.soil_moisture_percent, mean.light_lux);
+        printf("   Std dev: Temp=%.2f°C, Humidity=%.2f%%, Soil=%.2f%%, Light=%.1f lux\n",
+               stddev.temperature_celsius, stddev.humidity_percent,
+               stddev.soil_moisture_percent, stddev.light_lux);
+    }
+    
+    printf("\n✅ Demo 4 Complete: Data integration functional\n");
+}
+
+void demo_5_system_integration(raspberry_pi_core_t *core) {
+    if (!demo_begin(core, "DEMO 5: Complete System Integration")) return;
+    
+    printf("\n🎯 Testing Complete System Integration:\n");
+    
+    // Test full system cycle
+    printf("   1. System Status Check:\n");
+    char status_json[2048];
+    pi_core_get_system_status(core, status_json, sizeof(status_json));
+    printf("      - Status: %s\n", core->hardware->gpio_initialized ? "operational" : "simulation");
+    printf("      - Active Plants: %d\n", core->active_plants_count);
+    
+    printf("\n   2. Sensor Reading:\n");
+    sensor_data_t sensor_data = pi_core_read_all_sensors(core);
+    printf("      - All sensors: ✅ Operational\n");
+    
+    printf("\n   3. Plant Health Check:\n");
+    plant_validation_t validation_results[10];
+    pi_core_validate_sensor_readings(core, validation_results);
+    int healthy_plants = 0;
+    for (int i = 0; i < core->active_plants_count; i++) {
+        if (pi_core_validation_ok(&validation_results[i])) healthy_plants++;
+    }
+    printf("      - Healthy plants: %d/%d\n", healthy_plants, core->active_plants_count);
+    
+    printf("\n   4. Automatic Watering:\n");
+    plant_t plants_needing_water[10];
+    int count = pi_core_check_plants_needing_water(core, plants_needing_water);
+    if (count > 0) {
+        printf("      - Watering %d plants...\n", count);
+        pi_core_auto_water_plants(core);
+        demo_wait_for_pumps(core);
+    } else {
+        printf("      - No watering needed\n");
+    }
+    
+    printf("\n   5. System Monitoring:\n");
+    printf("      - Sensor history: %d readings\n", core->system_status.sensor_history_count);
+    char last_watered_str[64];
+    pi_core_format_timestamp(core->system_status.pump_status.last_watered, last_watered_str, sizeof(last_watered_str));
+    printf("      - Last watering: %s\n", core->system_status.pump_status.last_watered > 0 ? last_watered_str : "Never");
+    
+    printf("\n✅ Demo 5 Complete: Full system integration successful\n");
+}
+
+// Demo sequence, indexed by demo number - 1
+static void (*const core_demos[])(raspberry_pi_core_t*) = {
+    demo_1_hardware_setup,
+    demo_2_pump_control,
+    demo_3_sensor_integration,
+    demo_4_data_integration,
+    demo_5_system_integration
+};
+
+static const int core_demos_count = sizeof(core_demos) / sizeof(core_demos[0]);
+
+bool pi_core_run_demo(raspberry_pi_core_t *core, int demo_number) {
+    if (demo_number < 1 || demo_number > core_demos_count) return false;
+    
+    core_demos[demo_number - 1](core);
+    return true;
+}
+
+void run_all_demos(raspberry_pi_core_t *core) {
+    printf("🌱 RASPBERRY PI AUTOMATED PLANTER - DEMO SEQUENCE\n");
+    printf("============================================================\n");
+    
+    for (int i = 1; i <= core_demos_count; i++) {
+        printf("\nRunning Demo %d...\n", i);
+        pi_core_run_demo(core, i);
+        printf("\n✅ Demo %d completed successfully!\n", i);
+        printf("\nPress Enter to continue to next demo...");
+        getchar();
+    }
+    
+    printf("\n🎉 ALL DEMOS COMPLETED!\n");
+    printf("   - Raspberry Pi core system fully demonstrated\n");
+    printf("   - All 5 milestones achieved\n");
+    printf("   - System ready for integration with web interface\n");
+}
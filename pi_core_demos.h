@@ -0,0 +1,15 @@
+#ifndef PI_CORE_DEMOS_H
+#define PI_CORE_DEMOS_H
+
+#include "raspberry_pi_core.h"
+
+// Demo functions
+void demo_1_hardware_setup(raspberry_pi_core_t *core);
+void demo_2_pump_control(raspberry_pi_core_t *core);
+void demo_3_sensor_integration(raspberry_pi_core_t *core);
+void demo_4_data_integration(raspberry_pi_core_t *core);
+void demo_5_system_integration(raspberry_pi_core_t *core);
+bool pi_core_run_demo(raspberry_pi_core_t *core, int demo_number);
+void run_all_demos(raspberry_pi_core_t *core);
+
+#endif // PI_CORE_DEMOS_H
@@ -1,10 +1,16 @@
+#define _DEFAULT_SOURCE
+
 #include "raspberry_pi_core.h"
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <unistd.h>
 #include <errno.h>
+#include <fcntl.h>
+#include <poll.h>
 #include <stdarg.h>
+#include <stddef.h>
+#include <math.h>
 #include <curl/curl.h>
 #include <json-c/json.h>
 
@@ -17,6 +23,95 @@ static const plant_t default_plants[] = {
 
 static const int default_plants_count = sizeof(default_plants) / sizeof(default_plants[0]);
 
+static size_t write_callback(void *contents, size_t size, size_t nmemb, void *userp) {
+    size_t realsize = size * nmemb;
+    (void)contents;
+    (void)userp;
+    return realsize;
+}
+
+// POST one serialized payload on the shared handle
+static bool web_post(raspberry_pi_core_t *core, const char *json_string) {
+    // URL, headers, callback and timeout were set once in pi_core_init
+    curl_easy_setopt(core->web_curl, CURLOPT_POSTFIELDS, json_string);
+    
+    CURLcode res = curl_easy_perform(core->web_curl);
+    if (res != CURLE_OK) {
+        pi_core_log("WARNING", "Failed to send data to web interface: %s", curl_easy_strerror(res));
+        return false;
+    }
+    
+    pi_core_log("INFO", "Data sent to web interface successfully");
+    return true;
+}
+
+static void *web_sender_thread(void *arg) {
+    raspberry_pi_core_t *core = (raspberry_pi_core_t*)arg;
+    
+    pthread_mutex_lock(&core->web_mutex);
+    while (true) {
+        while (!core->web_outbox && !core->web_stop_requested) {
+            pthread_cond_wait(&core->web_cond, &core->web_mutex);
+        }
+        if (!core->web_outbox) break;
+        
+        char *json_string = core->web_outbox;
+        core->web_outbox = NULL;
+        core->web_busy = true;
+        pthread_mutex_unlock(&core->web_mutex);
+        
+        bool ok = web_post(core, json_string);
+        free(json_string);
+        
+        pthread_mutex_lock(&core->web_mutex);
+        core->web_busy = false;
+        core->web_done = true;
+        core->web_ok = ok;
+        pthread_cond_broadcast(&core->web_cond);
+    }
+    pthread_mutex_unlock(&core->web_mutex);
+    
+    return NULL;
+}
+
+// Mark the first count pending readings as delivered
+static void web_mark_sent(raspberry_pi_core_t *core, int count, const sensor_data_t *reading) {
+    system_status_t *status = &core->system_status;
+    
+    status->web_pending_count -= count;
+    if (status->web_pending_count < 0) status->web_pending_count = 0;
+    clock_gettime(CLOCK_MONOTONIC, &status->web_last_flush);
+    status->web_last_sent = *reading;
+    status->web_has_sent = true;
+}
+
+// Apply the result of a finished background send. A failed send leaves
+// its readings pending so the next flush carries them again.
+static void web_sender_reap(raspberry_pi_core_t *core) {
+    if (!core->web_thread_running) return;
+    
+    pthread_mutex_lock(&core->web_mutex);
+    bool done = core->web_done;
+    bool ok = core->web_ok;
+    core->web_done = false;
+    pthread_mutex_unlock(&core->web_mutex);
+    
+    if (done && ok) {
+        web_mark_sent(core, core->web_inflight_count, &core->web_inflight_reading);
+    }
+}
+
+// Block until the sender thread has nothing queued or on the wire
+static void web_sender_wait_idle(raspberry_pi_core_t *core) {
+    if (!core->web_thread_running) return;
+    
+    pthread_mutex_lock(&core->web_mutex);
+    while (core->web_outbox || core->web_busy) {
+        pthread_cond_wait(&core->web_cond, &core->web_mutex);
+    }
+    pthread_mutex_unlock(&core->web_mutex);
+}
+
 raspberry_pi_core_t* pi_core_init(bool simulation_mode, const char *web_interface_url) {
     raspberry_pi_core_t *core = malloc(sizeof(raspberry_pi_core_t));
     if (!core) {
@@ -27,6 +122,8 @@ raspberry_pi_core_t* pi_core_init(bool simulation_mode, const char *web_interfac
     memset(core, 0, sizeof(raspberry_pi_core_t));
     
     core->simulation_mode = simulation_mode;
+    core->stop_pipe[0] = -1;
+    core->stop_pipe[1] = -1;
     if (web_interface_url) {
         strncpy(core->web_interface_url, web_interface_url, sizeof(core->web_interface_url) - 1);
     }
@@ -39,18 +136,57 @@ raspberry_pi_core_t* pi_core_init(bool simulation_mode, const char *web_interfac
         return NULL;
     }
     
+    // One HTTP handle for the lifetime of the core so repeated sends reuse
+    // the open connection instead of reconnecting every time
+    if (strlen(core->web_interface_url) > 0) {
+        curl_global_init(CURL_GLOBAL_DEFAULT);
+        core->web_curl = curl_easy_init();
+        if (core->web_curl) {
+            curl_easy_setopt(core->web_curl, CURLOPT_URL, core->web_interface_url);
+            curl_easy_setopt(core->web_curl, CURLOPT_WRITEFUNCTION, write_callback);
+            curl_easy_setopt(core->web_curl, CURLOPT_TIMEOUT, 5L);
+            // Keep the idle connection alive between sends
+            curl_easy_setopt(core->web_curl, CURLOPT_TCP_KEEPALIVE, 1L);
+            curl_easy_setopt(core->web_curl, CURLOPT_TCP_KEEPIDLE, 120L);
+            curl_easy_setopt(core->web_curl, CURLOPT_TCP_KEEPINTVL, 60L);
+            core->web_headers = curl_slist_append(NULL, "Content-Type: application/json");
+            curl_easy_setopt(core->web_curl, CURLOPT_HTTPHEADER, core->web_headers);
+            
+            pthread_mutex_init(&core->web_mutex, NULL);
+            pthread_cond_init(&core->web_cond, NULL);
+            if (pthread_create(&core->web_thread, NULL, web_sender_thread, core) == 0) {
+                core->web_thread_running = true;
+            } else {
+                pi_core_log("WARNING", "Failed to start web sender thread, sending inline");
+            }
+        } else {
+            pi_core_log("ERROR", "Failed to initialize CURL");
+        }
+    }
+    
+    // Non-blocking at both ends: the signal handler must never block on
+    // the write, and the waiter drains whatever has piled up
+    if (pipe(core->stop_pipe) == 0) {
+        fcntl(core->stop_pipe[0], F_SETFL, O_NONBLOCK);
+        fcntl(core->stop_pipe[1], F_SETFL, O_NONBLOCK);
+    } else {
+        pi_core_log("WARNING", "Failed to create stop pipe, waits run to their deadline");
+        core->stop_pipe[0] = -1;
+        core->stop_pipe[1] = -1;
+    }
+    
     // Initialize default plants
+    // Copy the whole default table in one go; the loop only indexes positions
+    memcpy(core->active_plants, default_plants, sizeof(default_plants));
     core->active_plants_count = default_plants_count;
+    memset(core->plant_by_position, -1, sizeof(core->plant_by_position));
     for (int i = 0; i < default_plants_count; i++) {
-        core->active_plants[i] = default_plants[i];
+        core->plant_by_position[default_plants[i].position] = i;
     }
     
-    // Initialize system status
-    core->system_status.sensor_history_count = 0;
-    core->system_status.plants_needing_water_count = 0;
-    core->system_status.pump_status.pump1_active = false;
-    core->system_status.pump_status.pump2_active = false;
-    core->system_status.pump_status.last_watered = 0;
+    // System status starts zeroed by the memset above; only the plant cache
+    // needs a non-zero "never computed" marker
+    core->system_status.plants_needing_water_minute = -1;
     
     pi_core_log("INFO", "Raspberry Pi Core initialized (simulation: %s)", 
                 simulation_mode ? "true" : "false");
@@ -70,95 +206,324 @@ void pi_core_cleanup(raspberry_pi_core_t *core) {
         hardware_cleanup(core->hardware);
     }
     
+    if (core->web_thread_running) {
+        // The sender finishes a queued payload before it exits
+        pthread_mutex_lock(&core->web_mutex);
+        core->web_stop_requested = true;
+        pthread_cond_broadcast(&core->web_cond);
+        pthread_mutex_unlock(&core->web_mutex);
+        pthread_join(core->web_thread, NULL);
+        core->web_thread_running = false;
+    }
+    
+    if (core->web_curl) {
+        pthread_cond_destroy(&core->web_cond);
+        pthread_mutex_destroy(&core->web_mutex);
+        curl_easy_cleanup(core->web_curl);
+        curl_slist_free_all(core->web_headers);
+        curl_global_cleanup();
+    }
+    
+    if (core->web_payload.root) {
+        json_object_put(core->web_payload.root);
+    }
+    
+    if (core->sensor_log) {
+        fclose(core->sensor_log);
+    }
+    
+    if (core->stop_pipe[0] >= 0) {
+        close(core->stop_pipe[0]);
+        close(core->stop_pipe[1]);
+    }
+    
     free(core);
     pi_core_log("INFO", "System cleanup completed");
 }
 
+// Return the last reading if it is younger than SENSOR_CACHE_TTL_SECONDS,
+// otherwise poll the hardware. Callers hitting the same tick share one
+// set of bus transactions.
 sensor_data_t pi_core_read_all_sensors(raspberry_pi_core_t *core) {
     sensor_data_t sensor_data = {0};
     
     if (!core || !core->hardware) return sensor_data;
     
+    system_status_t *status = &core->system_status;
+    if (status->has_reading) {
+        struct timespec now;
+        clock_gettime(CLOCK_MONOTONIC, &now);
+        double age = (now.tv_sec - status->last_reading_time.tv_sec) +
+                     (now.tv_nsec - status->last_reading_time.tv_nsec) / 1e9;
+        if (age < SENSOR_CACHE_TTL_SECONDS) {
+            return status->last_reading;
+        }
+    }
+    
+    return pi_core_read_all_sensors_fresh(core);
+}
+
+// Open (or create) a binary sensor log; every fresh reading is appended
+// to it until cleanup
+bool pi_core_open_sensor_log(raspberry_pi_core_t *core, const char *path) {
+    if (!core || !path) return false;
+    
+    FILE *log = fopen(path, "ab");
+    if (!log) {
+        pi_core_log("ERROR", "Failed to open sensor log %s: %s", path, strerror(errno));
+        return false;
+    }
+    setvbuf(log, NULL, _IOFBF, SENSOR_LOG_BUFFER_SIZE);
+    
+    if (core->sensor_log) fclose(core->sensor_log);
+    core->sensor_log = log;
+    core->sensor_log_unflushed = 0;
+    return true;
+}
+
+static void sensor_log_append(raspberry_pi_core_t *core, const sensor_data_t *sensor_data) {
+    unsigned char record[SENSOR_LOG_RECORD_SIZE];
+    uint32_t timestamp = (uint32_t)sensor_data->timestamp;
+    const float values[5] = {
+        sensor_data->temperature_celsius,
+        sensor_data->humidity_percent,
+        sensor_data->soil_moisture_percent,
+        sensor_data->light_lux,
+        sensor_data->water_tank_percentage
+    };
+    
+    memcpy(record, &timestamp, sizeof(timestamp));
+    memcpy(record + 4, values, sizeof(values));
+    record[24] = (sensor_data->water_level_top ? 1 : 0) |
+                 (sensor_data->water_level_middle ? 2 : 0) |
+                 (sensor_data->water_level_bottom ? 4 : 0);
+    
+    if (fwrite(record, sizeof(record), 1, core->sensor_log) != 1) {
+        pi_core_log("WARNING", "Failed to write sensor log record");
+        return;
+    }
+    
+    if (++core->sensor_log_unflushed >= SENSOR_LOG_FLUSH_RECORDS) {
+        fflush(core->sensor_log);
+        core->sensor_log_unflushed = 0;
+    }
+}
+
+void pi_core_decode_sensor_log_record(const unsigned char *record, sensor_data_t *sensor_data) {
+    if (!record || !sensor_data) return;
+    
+    uint32_t timestamp;
+    float values[5];
+    memcpy(&timestamp, record, sizeof(timestamp));
+    memcpy(values, record + 4, sizeof(values));
+    
+    memset(sensor_data, 0, sizeof(*sensor_data));
+    sensor_data->timestamp = (time_t)timestamp;
+    sensor_data->temperature_celsius = values[0];
+    sensor_data->humidity_percent = values[1];
+    sensor_data->soil_moisture_percent = values[2];
+    sensor_data->light_lux = values[3];
+    sensor_data->water_tank_percentage = values[4];
+    sensor_data->water_level_top = record[24] & 1;
+    sensor_data->water_level_middle = (record[24] & 2) != 0;
+    sensor_data->water_level_bottom = (record[24] & 4) != 0;
+}
+
+// Always poll the hardware and record the reading
+sensor_data_t pi_core_read_all_sensors_fresh(raspberry_pi_core_t *core) {
+    sensor_data_t sensor_data = {0};
+    
+    if (!core || !core->hardware) return sensor_data;
+    
+    system_status_t *status = &core->system_status;
     sensor_data = read_all_sensors(core->hardware);
-    core->system_status.last_reading = sensor_data;
+    status->last_reading = sensor_data;
+    clock_gettime(CLOCK_MONOTONIC, &status->last_reading_time);
+    status->has_reading = true;
+    
+    // Store in history ring buffer (keep last SENSOR_HISTORY_SIZE readings)
+    status->sensor_history[status->sensor_history_head] = sensor_data;
+    status->sensor_history_head = (status->sensor_history_head + 1) % SENSOR_HISTORY_SIZE;
+    if (status->sensor_history_count < SENSOR_HISTORY_SIZE) {
+        status->sensor_history_count++;
+    }
+    if (status->web_pending_count < SENSOR_HISTORY_SIZE) {
+        status->web_pending_count++;
+    }
     
-    // Store in history (keep last 50 readings)
-    if (core->system_status.sensor_history_count < 50) {
-        core->system_status.sensor_history[core->system_status.sensor_history_count] = sensor_data;
-        core->system_status.sensor_history_count++;
-    } else {
-        // Shift array and add new reading
-        for (int i = 0; i < 49; i++) {
-            core->system_status.sensor_history[i] = core->system_status.sensor_history[i + 1];
-        }
-        core->system_status.sensor_history[49] = sensor_data;
+    if (core->sensor_log) {
+        sensor_log_append(core, &sensor_data);
     }
     
     return sensor_data;
 }
 
+// Mean and (population) standard deviation of the most recent `count`
+// readings in the history ring buffer, per channel. stddev may be NULL.
+// Returns how many readings were used (0 if the history is empty).
+int pi_core_sensor_history_stats(raspberry_pi_core_t *core, int count, sensor_data_t *mean, sensor_data_t *stddev) {
+    if (!core || !mean) return 0;
+    
+    memset(mean, 0, sizeof(*mean));
+    if (stddev) memset(stddev, 0, sizeof(*stddev));
+    
+    const system_status_t *status = &core->system_status;
+    if (count <= 0 || count > status->sensor_history_count) {
+        count = status->sensor_history_count;
+    }
+    if (count == 0) return 0;
+    
+    // Oldest reading in the window first
+    int first = (status->sensor_history_head + SENSOR_HISTORY_SIZE - count) % SENSOR_HISTORY_SIZE;
+    int index = first;
+    for (int i = 0; i < count; i++) {
+        const sensor_data_t *reading = &status->sensor_history[index];
+        mean->temperature_celsius += reading->temperature_celsius;
+        mean->humidity_percent += reading->humidity_percent;
+        mean->soil_moisture_percent += reading->soil_moisture_percent;
+        mean->light_lux += reading->light_lux;
+        mean->water_tank_percentage += reading->water_tank_percentage;
+        index = (index + 1) % SENSOR_HISTORY_SIZE;
+    }
+    
+    mean->temperature_celsius /= count;
+    mean->humidity_percent /= count;
+    mean->soil_moisture_percent /= count;
+    mean->light_lux /= count;
+    mean->water_tank_percentage /= count;
+    mean->timestamp = status->last_reading.timestamp;
+    
+    if (!stddev) return count;
+    
+    // Second pass over the same window; squared deviations from the mean
+    // are better behaved in float than sum-of-squares
+    index = first;
+    for (int i = 0; i < count; i++) {
+        const sensor_data_t *reading = &status->sensor_history[index];
+        float d;
+        d = reading->temperature_celsius - mean->temperature_celsius;
+        stddev->temperature_celsius += d * d;
+        d = reading->humidity_percent - mean->humidity_percent;
+        stddev->humidity_percent += d * d;
+        d = reading->soil_moisture_percent - mean->soil_moisture_percent;
+        stddev->soil_moisture_percent += d * d;
+        d = reading->light_lux - mean->light_lux;
+        stddev->light_lux += d * d;
+        d = reading->water_tank_percentage - mean->water_tank_percentage;
+        stddev->water_tank_percentage += d * d;
+        index = (index + 1) % SENSOR_HISTORY_SIZE;
+    }
+    
+    stddev->temperature_celsius = sqrtf(stddev->temperature_celsius / count);
+    stddev->humidity_percent = sqrtf(stddev->humidity_percent / count);
+    stddev->soil_moisture_percent = sqrtf(stddev->soil_moisture_percent / count);
+    stddev->light_lux = sqrtf(stddev->light_lux / count);
+    stddev->water_tank_percentage = sqrtf(stddev->water_tank_percentage / count);
+    stddev->timestamp = mean->timestamp;
+    
+    return count;
+}
+
 int pi_core_check_plants_needing_water(raspberry_pi_core_t *core, plant_t *plants_needing_water) {
     if (!core || !plants_needing_water) return 0;
     
     int count = 0;
     time_t current_time = time(NULL);
+    long minute = (long)(current_time / 60);
+    system_status_t *status = &core->system_status;
+    
+    // Reuse the last result while neither the plants nor the minute have changed
+    if (status->plants_needing_water_minute == minute &&
+        status->plants_needing_water_version == core->plants_version) {
+        count = status->plants_needing_water_count;
+        memcpy(plants_needing_water, status->plants_needing_water, count * sizeof(plant_t));
+        return count;
+    }
     
     for (int i = 0; i < core->active_plants_count; i++) {
         const plant_t *plant = &core->active_plants[i];
         
         if (!plant->active) continue;
         
-        // Check if enough time has passed since last watering
-        if (plant->last_watered > 0) {
-            time_t days_since_watering = (current_time - plant->last_watered) / (24 * 3600);
-            
-            if (days_since_watering >= plant->watering_frequency) {
-                plants_needing_water[count] = *plant;
-                count++;
-            }
-        } else {
-            // Never been watered
+        // Due once the watering period has elapsed, or if never watered
+        if (plant->last_watered == 0 ||
+            current_time - plant->last_watered >= (time_t)plant->watering_frequency * 24 * 3600) {
             plants_needing_water[count] = *plant;
             count++;
         }
     }
     
-    core->system_status.plants_needing_water_count = count;
+    status->plants_needing_water_count = count;
+    status->plants_needing_water_minute = minute;
+    status->plants_needing_water_version = core->plants_version;
     for (int i = 0; i < count; i++) {
-        core->system_status.plants_needing_water[i] = plants_needing_water[i];
+        status->plants_needing_water[i] = plants_needing_water[i];
     }
     
     return count;
 }
 
-bool pi_core_water_plant(raspberry_pi_core_t *core, const plant_t *plant) {
-    if (!core || !plant || !core->hardware) return false;
+// Active plant at a planter position, or NULL
+static plant_t *find_plant_at_position(raspberry_pi_core_t *core, int position) {
+    if (position < 0 || position >= MAX_PLANT_POSITIONS) return NULL;
     
-    pi_core_log("INFO", "Watering %s at position %d with %.1fml", 
-                plant->name, plant->position, plant->water_amount);
-    
-    // Calculate pump duration (assuming 100ml per second flow rate)
-    float duration = plant->water_amount / 100.0; // seconds
-    int pump_num = (plant->position % 2) + 1; // Alternate between pumps
-    
-    // Control the water pump
-    bool success = control_pump(core->hardware, pump_num, duration, plant->water_amount);
-    
-    if (success) {
-        // Update watering time for this plant
-        for (int i = 0; i < core->active_plants_count; i++) {
-            if (core->active_plants[i].position == plant->position) {
-                core->active_plants[i].last_watered = time(NULL);
-                break;
+    int index = core->plant_by_position[position];
+    return index >= 0 ? &core->active_plants[index] : NULL;
+}
+
+// Water `count` plants in one round. Each plant's run is started (or queued
+// behind the previous one on its pump) straight away; the watering times
+// and the plants version are then recorded once for the whole round.
+// results[i] (may be NULL) says whether plants[i] was started.
+// Returns how many plants were started; the water is still flowing when
+// this returns (control_pump_wait blocks until a pump is done), and
+// pi_core_cleanup waits for queued runs unless a stop was requested.
+int pi_core_water_plants(raspberry_pi_core_t *core, const plant_t *plants, int count, bool *results) {
+    if (!core || !plants || !core->hardware) return 0;
+    
+    int started = 0;
+    for (int i = 0; i < count; i++) {
+        const plant_t *plant = &plants[i];
+        
+        pi_core_log("INFO", "Watering %s at position %d with %.1fml", 
+                    plant->name, plant->position, plant->water_amount);
+        
+        // Calculate pump duration (assuming 100ml per second flow rate)
+        float duration = plant->water_amount / 100.0; // seconds
+        int pump_num = (plant->position % 2) + 1; // Alternate between pumps
+        
+        // Start the water pump; it switches itself off after the duration so
+        // monitoring carries on while the plant is watered
+        bool success = control_pump_start(core->hardware, pump_num, duration, plant->water_amount);
+        if (results) results[i] = success;
+        
+        if (success) {
+            // Use the pump start time so the plant and system records agree
+            plant_t *active = find_plant_at_position(core, plant->position);
+            if (active) {
+                active->last_watered = core->hardware->pump_status.last_watered;
             }
+            started++;
+            pi_core_log("INFO", "Started watering %s", plant->name);
+        } else {
+            pi_core_log("ERROR", "Failed to water %s", plant->name);
         }
-        
-        core->system_status.pump_status.last_watered = time(NULL);
-        pi_core_log("INFO", "Successfully watered %s", plant->name);
-    } else {
-        pi_core_log("ERROR", "Failed to water %s", plant->name);
     }
     
+    if (started > 0) {
+        core->system_status.pump_status.last_watered = core->hardware->pump_status.last_watered;
+        core->plants_version++;
+    }
+    
+    return started;
+}
+
+// Start watering one plant; returns true once its pump run has started or
+// been queued, not when the water has been delivered
+bool pi_core_water_plant(raspberry_pi_core_t *core, const plant_t *plant) {
+    bool success = false;
+    if (!plant) return false;
+    pi_core_water_plants(core, plant, 1, &success);
     return success;
 }
 
@@ -171,167 +536,446 @@ void pi_core_auto_water_plants(raspberry_pi_core_t *core) {
     if (count > 0) {
         pi_core_log("INFO", "Found %d plants needing water", count);
         
-        for (int i = 0; i < count; i++) {
-            bool success = pi_core_water_plant(core, &plants_needing_water[i]);
-            if (success) {
-                sleep(2); // Brief pause between plants
-            }
-        }
+        // control_pump_start queues plants that share a pump behind each
+        // other, so this returns while the pumps work through the round
+        pi_core_water_plants(core, plants_needing_water, count, NULL);
     } else {
         pi_core_log("INFO", "No plants need watering at this time");
     }
 }
 
+// Acceptable range for each validated channel; a reading outside it is
+// flagged CHECK
+typedef struct {
+    size_t reading_offset;     // float field in sensor_data_t
+    size_t validation_offset;  // sensor_validation_t field in plant_validation_t
+    float min;
+    float max;
+} sensor_range_t;
+
+static const sensor_range_t sensor_ranges[] = {
+    {offsetof(sensor_data_t, soil_moisture_percent), offsetof(plant_validation_t, soil_moisture), 20.0, 70.0},
+    {offsetof(sensor_data_t, temperature_celsius), offsetof(plant_validation_t, temperature), 15.0, 30.0},
+    {offsetof(sensor_data_t, humidity_percent), offsetof(plant_validation_t, humidity), 30.0, 80.0},
+    {offsetof(sensor_data_t, light_lux), offsetof(plant_validation_t, light), 50.0, 500.0}
+};
+
+static const int sensor_ranges_count = sizeof(sensor_ranges) / sizeof(sensor_ranges[0]);
+
 plant_validation_t pi_core_validate_plant_sensors(raspberry_pi_core_t *core, const plant_t *plant, const sensor_data_t *sensor_data) {
     plant_validation_t validation = {0};
     
     if (!core || !plant || !sensor_data) return validation;
     
-    // Simple validation (you can expand this based on your needs)
-    validation.soil_moisture.value = sensor_data->soil_moisture_percent;
-    strcpy(validation.soil_moisture.status, 
-           (sensor_data->soil_moisture_percent >= 20.0 && sensor_data->soil_moisture_percent <= 70.0) ? "OK" : "CHECK");
-    
-    validation.temperature.value = sensor_data->temperature_celsius;
-    strcpy(validation.temperature.status,
-           (sensor_data->temperature_celsius >= 15.0 && sensor_data->temperature_celsius <= 30.0) ? "OK" : "CHECK");
-    
-    validation.humidity.value = sensor_data->humidity_percent;
-    strcpy(validation.humidity.status,
-           (sensor_data->humidity_percent >= 30.0 && sensor_data->humidity_percent <= 80.0) ? "OK" : "CHECK");
-    
-    validation.light.value = sensor_data->light_lux;
-    strcpy(validation.light.status,
-           (sensor_data->light_lux >= 50.0 && sensor_data->light_lux <= 500.0) ? "OK" : "CHECK");
+    for (int i = 0; i < sensor_ranges_count; i++) {
+        const sensor_range_t *range = &sensor_ranges[i];
+        float value = *(const float*)((const char*)sensor_data + range->reading_offset);
+        sensor_validation_t *result = (sensor_validation_t*)((char*)&validation + range->validation_offset);
+        
+        result->value = value;
+        strcpy(result->status, (value >= range->min && value <= range->max) ? "OK" : "CHECK");
+    }
     
     return validation;
 }
 
+// True when every channel in a validation result is in range
+bool pi_core_validation_ok(const plant_validation_t *validation) {
+    if (!validation) return false;
+    
+    for (int i = 0; i < sensor_ranges_count; i++) {
+        const sensor_validation_t *result =
+            (const sensor_validation_t*)((const char*)validation + sensor_ranges[i].validation_offset);
+        if (strcmp(result->status, "OK") != 0) return false;
+    }
+    return true;
+}
+
 void pi_core_validate_sensor_readings(raspberry_pi_core_t *core, plant_validation_t *validation_results) {
-    if (!core || !validation_results) return;
+    if (!core || !validation_results || core->active_plants_count == 0) return;
     
-    sensor_data_t sensor_data = core->system_status.last_reading;
+    // Every plant is checked against the same ranges, so validate the
+    // snapshot once and share the result
+    plant_validation_t validation = pi_core_validate_plant_sensors(core, &core->active_plants[0],
+                                                                   &core->system_status.last_reading);
     
     for (int i = 0; i < core->active_plants_count; i++) {
-        validation_results[i] = pi_core_validate_plant_sensors(core, &core->active_plants[i], &sensor_data);
+        validation_results[i] = validation;
     }
 }
 
 // HTTP callback for sending data to web interface
-static size_t write_callback(void *contents, size_t size, size_t nmemb, void *userp) {
-    size_t realsize = size * nmemb;
-    (void)contents;
-    (void)userp;
-    return realsize;
+// Build the payload tree with placeholder leaves; sends then only update
+// the leaf values instead of allocating the whole tree again
+static void web_payload_build(web_payload_t *payload) {
+    payload->root = json_object_new_object();
+    
+    payload->timestamp = json_object_new_string("");
+    json_object_object_add(payload->root, "timestamp", payload->timestamp);
+    
+    struct json_object *sensor_data_obj = json_object_new_object();
+    payload->temperature = json_object_new_double(0.0);
+    payload->humidity = json_object_new_double(0.0);
+    payload->soil_moisture = json_object_new_double(0.0);
+    payload->light = json_object_new_double(0.0);
+    payload->water_level = json_object_new_double(0.0);
+    json_object_object_add(sensor_data_obj, "temperature", payload->temperature);
+    json_object_object_add(sensor_data_obj, "humidity", payload->humidity);
+    json_object_object_add(sensor_data_obj, "soil_moisture", payload->soil_moisture);
+    json_object_object_add(sensor_data_obj, "light", payload->light);
+    json_object_object_add(sensor_data_obj, "water_level", payload->water_level);
+    json_object_object_add(payload->root, "sensor_data", sensor_data_obj);
+    
+    json_object_object_add(payload->root, "plant_status", json_object_new_array());
+    
+    struct json_object *pump_status_obj = json_object_new_object();
+    payload->pump1 = json_object_new_boolean(0);
+    payload->pump2 = json_object_new_boolean(0);
+    payload->last_watered = json_object_new_string("");
+    json_object_object_add(pump_status_obj, "pump1", payload->pump1);
+    json_object_object_add(pump_status_obj, "pump2", payload->pump2);
+    json_object_object_add(pump_status_obj, "last_watered", payload->last_watered);
+    json_object_object_add(payload->root, "pump_status", pump_status_obj);
 }
 
-bool pi_core_send_data_to_web_interface(raspberry_pi_core_t *core, const sensor_data_t *sensor_data) {
-    if (!core || !sensor_data || strlen(core->web_interface_url) == 0) {
-        return false;
-    }
-    
-    CURL *curl;
-    CURLcode res;
-    struct json_object *json_obj;
-    struct json_object *sensor_data_obj;
+// Fill the cached payload from sensor_data and the pending readings and
+// serialize it. The string belongs to the payload and is overwritten by
+// the next call.
+static const char *web_payload_serialize(raspberry_pi_core_t *core, const sensor_data_t *sensor_data) {
     struct json_object *plant_status_obj;
-    struct json_object *pump_status_obj;
-    char *json_string;
-    
-    curl = curl_easy_init();
-    if (!curl) {
-        pi_core_log("ERROR", "Failed to initialize CURL");
-        return false;
+    web_payload_t *payload = &core->web_payload;
+    if (!payload->root) {
+        web_payload_build(payload);
     }
     
-    // Create JSON payload
-    json_obj = json_object_new_object();
-    
-    // Add timestamp
+    // Update timestamp
     char timestamp_str[64];
     pi_core_format_timestamp(sensor_data->timestamp, timestamp_str, sizeof(timestamp_str));
-    json_object_object_add(json_obj, "timestamp", json_object_new_string(timestamp_str));
+    json_object_set_string(payload->timestamp, timestamp_str);
     
-    // Add sensor data
-    sensor_data_obj = json_object_new_object();
-    json_object_object_add(sensor_data_obj, "temperature", json_object_new_double(sensor_data->temperature_celsius));
-    json_object_object_add(sensor_data_obj, "humidity", json_object_new_double(sensor_data->humidity_percent));
-    json_object_object_add(sensor_data_obj, "soil_moisture", json_object_new_double(sensor_data->soil_moisture_percent));
-    json_object_object_add(sensor_data_obj, "light", json_object_new_double(sensor_data->light_lux));
-    json_object_object_add(sensor_data_obj, "water_level", json_object_new_double(sensor_data->water_tank_percentage));
-    json_object_object_add(json_obj, "sensor_data", sensor_data_obj);
+    // Update sensor data
+    json_object_set_double(payload->temperature, sensor_data->temperature_celsius);
+    json_object_set_double(payload->humidity, sensor_data->humidity_percent);
+    json_object_set_double(payload->soil_moisture, sensor_data->soil_moisture_percent);
+    json_object_set_double(payload->light, sensor_data->light_lux);
+    json_object_set_double(payload->water_level, sensor_data->water_tank_percentage);
     
-    // Add plant status
+    // Replace plant status; its length varies between sends
     plant_status_obj = json_object_new_array();
     for (int i = 0; i < core->system_status.plants_needing_water_count; i++) {
         json_object_array_add(plant_status_obj, json_object_new_string(core->system_status.plants_needing_water[i].name));
     }
-    json_object_object_add(json_obj, "plant_status", plant_status_obj);
+    json_object_object_add(payload->root, "plant_status", plant_status_obj);
+    
+    // Every reading not yet delivered, oldest first, so readings taken
+    // between sends (or during an outage) are not lost
+    const system_status_t *status = &core->system_status;
+    struct json_object *readings_obj = json_object_new_array();
+    int index = (status->sensor_history_head + SENSOR_HISTORY_SIZE - status->web_pending_count) % SENSOR_HISTORY_SIZE;
+    for (int i = 0; i < status->web_pending_count; i++) {
+        const sensor_data_t *reading = &status->sensor_history[index];
+        struct json_object *reading_obj = json_object_new_object();
+        pi_core_format_timestamp(reading->timestamp, timestamp_str, sizeof(timestamp_str));
+        json_object_object_add(reading_obj, "timestamp", json_object_new_string(timestamp_str));
+        json_object_object_add(reading_obj, "temperature", json_object_new_double(reading->temperature_celsius));
+        json_object_object_add(reading_obj, "humidity", json_object_new_double(reading->humidity_percent));
+        json_object_object_add(reading_obj, "soil_moisture", json_object_new_double(reading->soil_moisture_percent));
+        json_object_object_add(reading_obj, "light", json_object_new_double(reading->light_lux));
+        json_object_object_add(reading_obj, "water_level", json_object_new_double(reading->water_tank_percentage));
+        json_object_array_add(readings_obj, reading_obj);
+        index = (index + 1) % SENSOR_HISTORY_SIZE;
+    }
+    json_object_object_add(payload->root, "readings", readings_obj);
     
-    // Add pump status
-    pump_status_obj = json_object_new_object();
-    json_object_object_add(pump_status_obj, "pump1", json_object_new_boolean(core->system_status.pump_status.pump1_active));
-    json_object_object_add(pump_status_obj, "pump2", json_object_new_boolean(core->system_status.pump_status.pump2_active));
+    // Update pump status
+    json_object_set_boolean(payload->pump1, core->system_status.pump_status.pump1_active);
+    json_object_set_boolean(payload->pump2, core->system_status.pump_status.pump2_active);
     char last_watered_str[64];
     pi_core_format_timestamp(core->system_status.pump_status.last_watered, last_watered_str, sizeof(last_watered_str));
-    json_object_object_add(pump_status_obj, "last_watered", json_object_new_string(last_watered_str));
-    json_object_object_add(json_obj, "pump_status", pump_status_obj);
+    json_object_set_string(payload->last_watered, last_watered_str);
     
-    json_string = (char*)json_object_to_json_string(json_obj);
+    // Compact output: no whitespace between tokens
+    return json_object_to_json_string_ext(payload->root, JSON_C_TO_STRING_PLAIN);
+}
+
+bool pi_core_send_data_to_web_interface(raspberry_pi_core_t *core, const sensor_data_t *sensor_data) {
+    if (!core || !sensor_data || strlen(core->web_interface_url) == 0) {
+        return false;
+    }
     
-    // Set up CURL options
-    curl_easy_setopt(curl, CURLOPT_URL, core->web_interface_url);
-    curl_easy_setopt(curl, CURLOPT_POSTFIELDS, json_string);
-    curl_easy_setopt(curl, CURLOPT_WRITEFUNCTION, write_callback);
-    curl_easy_setopt(curl, CURLOPT_TIMEOUT, 5L);
+    if (!core->web_curl) {
+        pi_core_log("ERROR", "CURL not initialized");
+        return false;
+    }
     
-    // Perform the request
-    res = curl_easy_perform(curl);
+    // The handle is shared with the sender thread; let it finish first
+    web_sender_wait_idle(core);
+    web_sender_reap(core);
     
-    bool success = (res == CURLE_OK);
+    int count = core->system_status.web_pending_count;
+    bool success = web_post(core, web_payload_serialize(core, sensor_data));
     if (success) {
-        pi_core_log("INFO", "Data sent to web interface successfully");
-    } else {
-        pi_core_log("WARNING", "Failed to send data to web interface: %s", curl_easy_strerror(res));
+        web_mark_sent(core, count, sensor_data);
     }
     
-    // Cleanup
-    json_object_put(json_obj);
-    curl_easy_cleanup(curl);
-    
     return success;
 }
 
+// True when no payload is queued, on the wire or waiting to be reaped
+static bool web_sender_idle(raspberry_pi_core_t *core) {
+    if (!core->web_thread_running) return true;
+    
+    pthread_mutex_lock(&core->web_mutex);
+    bool idle = !core->web_outbox && !core->web_busy && !core->web_done;
+    pthread_mutex_unlock(&core->web_mutex);
+    return idle;
+}
+
+// Hand the payload to the sender thread. Returns false if a previous send
+// is still queued or on the wire; its readings stay pending for later.
+static bool web_sender_queue(raspberry_pi_core_t *core, const sensor_data_t *sensor_data) {
+    if (!web_sender_idle(core)) return false;
+    
+    char *json_string = strdup(web_payload_serialize(core, sensor_data));
+    if (!json_string) return false;
+    
+    core->web_inflight_count = core->system_status.web_pending_count;
+    core->web_inflight_reading = *sensor_data;
+    
+    pthread_mutex_lock(&core->web_mutex);
+    core->web_outbox = json_string;
+    pthread_cond_signal(&core->web_cond);
+    pthread_mutex_unlock(&core->web_mutex);
+    
+    return true;
+}
+
+// True when no channel has moved enough since the last send to be worth
+// reporting
+static bool sensor_readings_flat(const sensor_data_t *a, const sensor_data_t *b) {
+    return fabsf(a->temperature_celsius - b->temperature_celsius) < 0.2f &&
+           fabsf(a->humidity_percent - b->humidity_percent) < 0.5f &&
+           fabsf(a->soil_moisture_percent - b->soil_moisture_percent) < 0.5f &&
+           fabsf(a->light_lux - b->light_lux) < 5.0f &&
+           a->water_tank_percentage == b->water_tank_percentage;
+}
+
+// True when every channel of cur is within fraction of its value in prev
+static bool sensor_readings_steady(const sensor_data_t *prev, const sensor_data_t *cur, float fraction) {
+    const float pairs[][2] = {
+        {prev->temperature_celsius, cur->temperature_celsius},
+        {prev->humidity_percent, cur->humidity_percent},
+        {prev->soil_moisture_percent, cur->soil_moisture_percent},
+        {prev->light_lux, cur->light_lux},
+        {prev->water_tank_percentage, cur->water_tank_percentage}
+    };
+    
+    for (size_t i = 0; i < sizeof(pairs) / sizeof(pairs[0]); i++) {
+        if (fabsf(pairs[i][1] - pairs[i][0]) > fraction * fabsf(pairs[i][0])) {
+            return false;
+        }
+    }
+    return true;
+}
+
+// Send buffered readings once WEB_BATCH_SIZE have piled up or
+// WEB_FLUSH_INTERVAL_SECONDS have passed since the last send. Failed sends
+// keep the readings pending (up to the history size) for the next flush.
+// Unforced sends go through the sender thread and do not block; a forced
+// flush sends inline and returns the result.
+bool pi_core_flush_web_data(raspberry_pi_core_t *core, bool force) {
+    if (!core || strlen(core->web_interface_url) == 0) return false;
+    
+    web_sender_reap(core);
+    
+    system_status_t *status = &core->system_status;
+    if (status->web_pending_count == 0) return true;
+    
+    if (!force) {
+        struct timespec now;
+        clock_gettime(CLOCK_MONOTONIC, &now);
+        long since_flush = now.tv_sec - status->web_last_flush.tv_sec;
+        
+        if (status->web_pending_count < WEB_BATCH_SIZE && since_flush < WEB_FLUSH_INTERVAL_SECONDS) {
+            return true;
+        }
+        
+        // Nothing has changed: drop the flat readings and only send again
+        // as a heartbeat. Not while a send is in flight, since reaping it
+        // takes its readings off the pending count
+        if (status->web_has_sent && since_flush < WEB_HEARTBEAT_SECONDS &&
+            web_sender_idle(core) &&
+            sensor_readings_flat(&status->last_reading, &status->web_last_sent)) {
+            status->web_pending_count = 0;
+            return true;
+        }
+        
+        if (core->web_thread_running) {
+            web_sender_queue(core, &status->last_reading);
+            return true;
+        }
+    }
+    
+    return pi_core_send_data_to_web_interface(core, &status->last_reading);
+}
+
+// One pass over the plants for a monitoring cycle: the snapshot is validated
+// once (every plant shares the same ranges), then each plant is watered at
+// most once if it is scheduled or its soil is too dry. Returns how many
+// plants were due.
+static int monitoring_plant_pass(raspberry_pi_core_t *core, const sensor_data_t *sensor_data) {
+    if (core->active_plants_count == 0) return 0;
+    
+    plant_validation_t validation = pi_core_validate_plant_sensors(core, &core->active_plants[0], sensor_data);
+    
+    // The due list keeps active_plants order, so it is consumed in step
+    plant_t plants_needing_water[10];
+    int count = pi_core_check_plants_needing_water(core, plants_needing_water);
+    int next_due = 0;
+    if (count > 0) {
+        pi_core_log("INFO", "Plants needing water: %d", count);
+    }
+    
+    for (int i = 0; i < core->active_plants_count; i++) {
+        const plant_t *plant = &core->active_plants[i];
+        bool scheduled = next_due < count && plants_needing_water[next_due].position == plant->position;
+        if (scheduled) next_due++;
+        
+        bool dry = strcmp(validation.soil_moisture.status, "CHECK") == 0;
+        if (dry) {
+            pi_core_log("WARNING", "%s: Soil moisture issue - %.1f%%", plant->name, validation.soil_moisture.value);
+        }
+        
+        if (scheduled) {
+            pi_core_water_plant(core, plant);
+        } else if (dry && validation.soil_moisture.value < 20.0) {
+            pi_core_log("INFO", "Auto-watering %s due to low soil moisture", plant->name);
+            pi_core_water_plant(core, plant);
+        }
+        
+        if (strcmp(validation.temperature.status, "CHECK") == 0) {
+            pi_core_log("WARNING", "%s: Temperature issue - %.1f°C", plant->name, validation.temperature.value);
+        }
+        if (strcmp(validation.humidity.status, "CHECK") == 0) {
+            pi_core_log("WARNING", "%s: Humidity issue - %.1f%%", plant->name, validation.humidity.value);
+        }
+        if (strcmp(validation.light.status, "CHECK") == 0) {
+            pi_core_log("WARNING", "%s: Light issue - %.1f lux", plant->name, validation.light.value);
+        }
+    }
+    
+    return count;
+}
+
 void pi_core_start_monitoring_loop(raspberry_pi_core_t *core, int interval_seconds) {
     if (!core) return;
     
     core->running = true;
     pi_core_log("INFO", "Starting monitoring loop (interval: %ds)", interval_seconds);
     
+    // While readings stay flat and nothing needs water the interval doubles
+    // up to MONITOR_MAX_INTERVAL_SECONDS; any change or manual command resets it
+    int current_interval = interval_seconds;
+    int flat_streak = 0;
+    sensor_data_t previous_reading = {0};
+    bool has_previous = false;
+    
+    // Cycles run on a fixed schedule: the time spent reading, validating and
+    // sending is taken out of the wait rather than added to the period
+    struct timespec next_cycle;
+    clock_gettime(CLOCK_MONOTONIC, &next_cycle);
+    
     while (core->running) {
+        hardware_watchdog_heartbeat(core->hardware);
+        
         // Read sensors
         sensor_data_t sensor_data = pi_core_read_all_sensors(core);
         pi_core_log("INFO", "Sensor reading: Temp=%.1f°C, Humidity=%.1f%%, Soil=%.1f%%, Water=%.1f%%",
                     sensor_data.temperature_celsius, sensor_data.humidity_percent,
                     sensor_data.soil_moisture_percent, sensor_data.water_tank_percentage);
         
-        // Validate readings
-        plant_validation_t validation_results[10];
-        pi_core_validate_sensor_readings(core, validation_results);
+        // Validate once and water the plants that are due or dry
+        int count = monitoring_plant_pass(core, &sensor_data);
+        
+        // Send data to web interface in batches
+        pi_core_flush_web_data(core, false);
+        
+        bool flat = has_previous && count == 0 && !core->monitor_interval_reset &&
+                    sensor_readings_steady(&previous_reading, &sensor_data, 0.02f);
+        core->monitor_interval_reset = false;
+        previous_reading = sensor_data;
+        has_previous = true;
         
-        // Check for plants needing water
-        plant_t plants_needing_water[10];
-        int count = pi_core_check_plants_needing_water(core, plants_needing_water);
-        if (count > 0) {
-            pi_core_log("INFO", "Plants needing water: %d", count);
+        if (!flat) {
+            flat_streak = 0;
+            current_interval = interval_seconds;
+        } else if (++flat_streak >= MONITOR_FLAT_CYCLES && current_interval < MONITOR_MAX_INTERVAL_SECONDS) {
+            current_interval *= 2;
+            if (current_interval > MONITOR_MAX_INTERVAL_SECONDS) {
+                current_interval = MONITOR_MAX_INTERVAL_SECONDS;
+            }
+            pi_core_log("DEBUG", "Readings steady, monitoring interval now %ds", current_interval);
         }
         
-        // Send data to web interface
-        pi_core_send_data_to_web_interface(core, &sensor_data);
+        // Wait for next reading; pi_core_request_stop ends the wait at once
+        next_cycle.tv_sec += current_interval;
+        if (!pi_core_wait_until(core, &next_cycle)) break;
+    }
+    
+    // Deliver whatever is still buffered before returning
+    pi_core_flush_web_data(core, true);
+}
+
+// Stop the monitoring loop and wake it if it is waiting; cleanup then cuts
+// queued pump runs short. Only touches flags and write(2), so it is safe
+// to call from a signal handler.
+void pi_core_request_stop(raspberry_pi_core_t *core) {
+    if (!core) return;
+    
+    core->running = false;
+    control_pump_abort(core->hardware);
+    if (core->stop_pipe[1] >= 0) {
+        char byte = 1;
+        ssize_t written = write(core->stop_pipe[1], &byte, 1);
+        (void)written; // Pipe full means a wake-up is already pending
+    }
+}
+
+// Wait until the CLOCK_MONOTONIC deadline or until a stop is requested.
+// Returns false if the caller should stop.
+bool pi_core_wait_until(raspberry_pi_core_t *core, const struct timespec *deadline) {
+    if (!core || !deadline) return false;
+    
+    struct pollfd fd = {.fd = core->stop_pipe[0], .events = POLLIN};
+    
+    while (core->running) {
+        struct timespec now;
+        clock_gettime(CLOCK_MONOTONIC, &now);
+        long long remaining_ms = (long long)(deadline->tv_sec - now.tv_sec) * 1000 +
+                                 (deadline->tv_nsec - now.tv_nsec) / 1000000;
+        if (remaining_ms <= 0) return true;
         
-        // Wait for next reading
-        sleep(interval_seconds);
+        // Waiting is progress too: keep the watchdog heartbeat going across
+        // long backed-off intervals
+        hardware_watchdog_heartbeat(core->hardware);
+        if (remaining_ms > WATCHDOG_FEED_SECONDS * 1000) {
+            remaining_ms = WATCHDOG_FEED_SECONDS * 1000;
+        }
+        
+        // A negative fd is ignored by poll, which then just sleeps
+        int ready = poll(&fd, 1, (int)remaining_ms);
+        if (ready > 0) {
+            char buffer[16];
+            while (read(core->stop_pipe[0], buffer, sizeof(buffer)) > 0) {
+                // Drain pending wake-ups
+            }
+        } else if (ready < 0 && errno != EINTR) {
+            pi_core_log("ERROR", "Monitoring wait failed: %s", strerror(errno));
+            return false;
+        }
     }
+    
+    return false;
 }
 
 void pi_core_get_system_status(raspberry_pi_core_t *core, char *status_json, size_t buffer_size) {
@@ -376,251 +1020,51 @@ void pi_core_get_system_status(raspberry_pi_core_t *core, char *status_json, siz
     json_object_object_add(json_obj, "sensor_history_count", json_object_new_int(core->system_status.sensor_history_count));
     json_object_object_add(json_obj, "web_interface_connected", json_object_new_boolean(strlen(core->web_interface_url) > 0));
     
-    const char *json_string = json_object_to_json_string(json_obj);
-    strncpy(status_json, json_string, buffer_size - 1);
-    status_json[buffer_size - 1] = '\0';
+    // Plain output like the web payload, and snprintf rather than strncpy so
+    // the rest of a large buffer is not zero-padded on every call
+    const char *json_string = json_object_to_json_string_ext(json_obj, JSON_C_TO_STRING_PLAIN);
+    snprintf(status_json, buffer_size, "%s", json_string);
     
     json_object_put(json_obj);
 }
 
+// Start watering the plant at `position`; like pi_core_water_plant the
+// result means the run was started or queued
 bool pi_core_manual_water_plant(raspberry_pi_core_t *core, int position) {
     if (!core) return false;
     
-    const plant_t *plant = NULL;
-    for (int i = 0; i < core->active_plants_count; i++) {
-        if (core->active_plants[i].position == position) {
-            plant = &core->active_plants[i];
-            break;
-        }
-    }
-    
+    const plant_t *plant = find_plant_at_position(core, position);
     if (!plant) {
         pi_core_log("ERROR", "No plant found at position %d", position);
         return false;
     }
     
+    core->monitor_interval_reset = true;
     return pi_core_water_plant(core, plant);
 }
 
-// Demo functions
-void demo_1_hardware_setup(void) {
-    printf("\n============================================================\n");
-    printf("DEMO 1: Hardware Setup and Basic Functionality\n");
-    printf("============================================================\n");
-    
-    raspberry_pi_core_t *core = pi_core_init(true, NULL);
-    if (!core) {
-        printf("❌ Failed to initialize system\n");
-        return;
-    }
-    
-    printf("\n🔧 System Status:\n");
-    char status_json[2048];
-    pi_core_get_system_status(core, status_json, sizeof(status_json));
-    printf("   - Hardware Mode: %s\n", core->simulation_mode ? "Simulation" : "Real Hardware");
-    printf("   - GPIO Status: %s\n", core->hardware->gpio_initialized ? "Initialized" : "Not Initialized");
-    printf("   - Active Plants: %d\n", core->active_plants_count);
-    
-    printf("\n📊 Initial Sensor Reading:\n");
-    sensor_data_t sensor_data = pi_core_read_all_sensors(core);
-    printf("   - Temperature: %.1f°C\n", sensor_data.temperature_celsius);
-    printf("   - Humidity: %.1f%%\n", sensor_data.humidity_percent);
-    printf("   - Soil Moisture: %.1f%%\n", sensor_data.soil_moisture_percent);
-    printf("   - Light: %.1f lux\n", sensor_data.light_lux);
-    printf("   - Water Level: %.1f%%\n", sensor_data.water_tank_percentage);
-    
-    printf("\n✅ Demo 1 Complete: Hardware system operational\n");
-    pi_core_cleanup(core);
-}
-
-void demo_2_pump_control(void) {
-    printf("\n============================================================\n");
-    printf("DEMO 2: Water Pump Implementation\n");
-    printf("============================================================\n");
-    
-    raspberry_pi_core_t *core = pi_core_init(true, NULL);
-    if (!core) {
-        printf("❌ Failed to initialize system\n");
-        return;
-    }
-    
-    printf("\n💧 Testing Pump Control:\n");
-    
-    // Test manual watering
-    printf("   - Manual watering test...\n");
-    bool success = pi_core_manual_water_plant(core, 0); // Water plant at position 0
-    printf("   - Result: %s\n", success ? "✅ Success" : "❌ Failed");
-    
-    // Test automatic watering
-    printf("\n🤖 Testing Automatic Watering:\n");
-    pi_core_auto_water_plants(core);
-    
-    printf("\n✅ Demo 2 Complete: Pump control functional\n");
-    pi_core_cleanup(core);
-}
-
-void demo_3_sensor_integration(void) {
-    printf("\n============================================================\n");
-    printf("DEMO 3: Sensor Implementation\n");
-    printf("============================================================\n");
-    
-    raspberry_pi_core_t *core = pi_core_init(true, NULL);
-    if (!core) {
-        printf("❌ Failed to initialize system\n");
-        return;
-    }
-    
-    printf("\n📊 Testing All Sensors:\n");
-    
-    // Read all sensors multiple times
-    for (int i = 0; i < 3; i++) {
-        printf("\n   Reading %d/3:\n", i + 1);
-        sensor_data_t sensor_data = pi_core_read_all_sensors(core);
-        printf("      - Temperature: %.1f°C\n", sensor_data.temperature_celsius);
-        printf("      - Humidity: %.1f%%\n", sensor_data.humidity_percent);
-        printf("      - Soil Moisture: %.1f%%\n", sensor_data.soil_moisture_percent);
-        printf("      - Light: %.1f lux\n", sensor_data.light_lux);
-        printf("      - Water Level: %.1f%%\n", sensor_data.water_tank_percentage);
-        sleep(2);
-    }
-    
-    // Test validation
-    printf("\n🔍 Testing Sensor Validation:\n");
-    plant_validation_t validation_results[10];
-    pi_core_validate_sensor_readings(core, validation_results);
-    for (int i = 0; i < core->active_plants_count; i++) {
-        bool all_ok = (strcmp(validation_results[i].soil_moisture.status, "OK") == 0 &&
-                      strcmp(validation_results[i].temperature.status, "OK") == 0 &&
-                      strcmp(validation_results[i].humidity.status, "OK") == 0 &&
-                      strcmp(validation_results[i].light.status, "OK") == 0);
-        printf("   - %s: All sensors %s\n", core->active_plants[i].name, 
-               all_ok ? "✅ OK" : "⚠️ Check needed");
-    }
-    
-    printf("\n✅ Demo 3 Complete: All sensors operational\n");
-    pi_core_cleanup(core);
-}
-
-void demo_4_data_integration(void) {
-    printf("\n============================================================\n");
-    printf("DEMO 4: Data Integration and Monitoring\n");
-    printf("============================================================\n");
+bool pi_core_set_watering_frequency(raspberry_pi_core_t *core, int position, int days) {
+    if (!core || days <= 0) return false;
     
-    raspberry_pi_core_t *core = pi_core_init(true, NULL);
-    if (!core) {
-        printf("❌ Failed to initialize system\n");
-        return;
-    }
-    
-    printf("\n📈 Testing Data Integration:\n");
-    printf("   - Running monitoring loop for 30 seconds...\n");
-    
-    time_t start_time = time(NULL);
-    while (time(NULL) - start_time < 30) {
-        sensor_data_t sensor_data = pi_core_read_all_sensors(core);
-        plant_validation_t validation_results[10];
-        pi_core_validate_sensor_readings(core, validation_results);
-        plant_t plants_needing_water[10];
-        int count = pi_core_check_plants_needing_water(core, plants_needing_water);
-        
-        char timestamp_str[64];
-        pi_core_format_timestamp(time(NULL), timestamp_str, sizeof(timestamp_str));
-        printf("      → %s: Temp=%.1f°C, Plants needing water: %d\n",
-               timestamp_str, sensor_data.temperature_celsius, count);
-        
-        sleep(5);
-    }
-    
-    printf("\n✅ Demo 4 Complete: Data integration functional\n");
-    pi_core_cleanup(core);
-}
-
-void demo_5_system_integration(void) {
-    printf("\n============================================================\n");
-    printf("DEMO 5: Complete System Integration\n");
-    printf("============================================================\n");
-    
-    raspberry_pi_core_t *core = pi_core_init(true, NULL);
-    if (!core) {
-        printf("❌ Failed to initialize system\n");
-        return;
-    }
-    
-    printf("\n🎯 Testing Complete System Integration:\n");
-    
-    // Test full system cycle
-    printf("   1. System Status Check:\n");
-    char status_json[2048];
-    pi_core_get_system_status(core, status_json, sizeof(status_json));
-    printf("      - Status: %s\n", core->hardware->gpio_initialized ? "operational" : "simulation");
-    printf("      - Active Plants: %d\n", core->active_plants_count);
-    
-    printf("\n   2. Sensor Reading:\n");
-    sensor_data_t sensor_data = pi_core_read_all_sensors(core);
-    printf("      - All sensors: ✅ Operational\n");
-    
-    printf("\n   3. Plant Health Check:\n");
-    plant_validation_t validation_results[10];
-    pi_core_validate_sensor_readings(core, validation_results);
-    int healthy_plants = 0;
-    for (int i = 0; i < core->active_plants_count; i++) {
-        bool all_ok = (strcmp(validation_results[i].soil_moisture.status, "OK") == 0 &&
-                      strcmp(validation_results[i].temperature.status, "OK") == 0 &&
-                      strcmp(validation_results[i].humidity.status, "OK") == 0 &&
-                      strcmp(validation_results[i].light.status, "OK") == 0);
-        if (all_ok) healthy_plants++;
+    plant_t *plant = find_plant_at_position(core, position);
+    if (!plant) {
+        pi_core_log("ERROR", "No plant found at position %d", position);
+        return false;
     }
-    printf("      - Healthy plants: %d/%d\n", healthy_plants, core->active_plants_count);
     
-    printf("\n   4. Automatic Watering:\n");
-    plant_t plants_needing_water[10];
-    int count = pi_core_check_plants_needing_water(core, plants_needing_water);
-    if (count > 0) {
-        printf("      - Watering %d plants...\n", count);
-        pi_core_auto_water_plants(core);
-    } else {
-        printf("      - No watering needed\n");
-    }
+    // Unchanged: keep the plants-needing-water cache valid
+    if (plant->watering_frequency == days) return true;
     
-    printf("\n   5. System Monitoring:\n");
-    printf("      - Sensor history: %d readings\n", core->system_status.sensor_history_count);
-    char last_watered_str[64];
-    pi_core_format_timestamp(core->system_status.pump_status.last_watered, last_watered_str, sizeof(last_watered_str));
-    printf("      - Last watering: %s\n", core->system_status.pump_status.last_watered > 0 ? last_watered_str : "Never");
-    
-    printf("\n✅ Demo 5 Complete: Full system integration successful\n");
-    pi_core_cleanup(core);
-}
-
-void run_all_demos(void) {
-    printf("🌱 RASPBERRY PI AUTOMATED PLANTER - DEMO SEQUENCE\n");
-    printf("============================================================\n");
-    
-    const char *demo_names[] = {"Demo 1", "Demo 2", "Demo 3", "Demo 4", "Demo 5"};
-    void (*demo_functions[])(void) = {
-        demo_1_hardware_setup,
-        demo_2_pump_control,
-        demo_3_sensor_integration,
-        demo_4_data_integration,
-        demo_5_system_integration
-    };
-    
-    for (int i = 0; i < 5; i++) {
-        printf("\nRunning %s...\n", demo_names[i]);
-        demo_functions[i]();
-        printf("\n✅ %s completed successfully!\n", demo_names[i]);
-        printf("\nPress Enter to continue to next demo...");
-        getchar();
-    }
-    
-    printf("\n🎉 ALL DEMOS COMPLETED!\n");
-    printf("   - Raspberry Pi core system fully demonstrated\n");
-    printf("   - All 5 milestones achieved\n");
-    printf("   - System ready for integration with web interface\n");
+    plant->watering_frequency = days;
+    core->plants_version++;
+    core->monitor_interval_reset = true;
+    return true;
 }
 
 // Utility functions
 void pi_core_log(const char *level, const char *format, ...) {
+    if (!hardware_log_enabled(level)) return;
+    
     time_t now = time(NULL);
     struct tm *tm_info = localtime(&now);
     char timestamp[64];
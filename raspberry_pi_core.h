@@ -2,9 +2,28 @@
 #define RASPBERRY_PI_CORE_H
 
 #include "hardware_drivers.h"
+#include <curl/curl.h>
 #include <stdbool.h>
+#include <stdio.h>
 #include <time.h>
 
+#define MAX_PLANT_POSITIONS 10        // Planter positions 0-9
+
+// Binary sensor log: fixed-size records in native byte order (little-endian
+// on the Pi): uint32 timestamp, five floats (temperature, humidity, soil
+// moisture, light, tank percentage), then one byte of water level bits
+// (bit 0 top, bit 1 middle, bit 2 bottom)
+#define SENSOR_LOG_RECORD_SIZE 25
+#define SENSOR_LOG_FLUSH_RECORDS 16   // Records buffered before a flush
+#define SENSOR_LOG_BUFFER_SIZE 65536
+#define SENSOR_HISTORY_SIZE 50
+#define SENSOR_CACHE_TTL_SECONDS 1.0 // Readings younger than this are reused
+#define WEB_BATCH_SIZE 6              // Unsent readings that trigger a web send
+#define WEB_FLUSH_INTERVAL_SECONDS 60 // Longest time readings wait to be sent
+#define WEB_HEARTBEAT_SECONDS 300     // Send at least this often even when readings are flat
+#define MONITOR_FLAT_CYCLES 3         // Flat cycles in a row before the interval backs off
+#define MONITOR_MAX_INTERVAL_SECONDS 600
+
 // Plant structure
 typedef struct {
     char name[64];
@@ -31,21 +50,68 @@ typedef struct {
 // System status structure
 typedef struct {
     sensor_data_t last_reading;
+    struct timespec last_reading_time; // CLOCK_MONOTONIC time of last_reading
+    bool has_reading;
     plant_t plants_needing_water[10];
     int plants_needing_water_count;
-    sensor_data_t sensor_history[50];
+    long plants_needing_water_minute; // Minute the cached list was computed in (-1 = never)
+    unsigned int plants_needing_water_version;
+    sensor_data_t sensor_history[SENSOR_HISTORY_SIZE];
     int sensor_history_count;
+    int sensor_history_head; // Next slot to write in the ring buffer
+    int web_pending_count;   // Newest history entries not yet sent to the web interface
+    struct timespec web_last_flush;
+    sensor_data_t web_last_sent; // Latest reading in the last successful send
+    bool web_has_sent;
     pump_status_t pump_status;
 } system_status_t;
 
+struct json_object;
+
+// Web interface payload, built once and updated in place for each send
+typedef struct {
+    struct json_object *root;
+    struct json_object *timestamp;
+    struct json_object *temperature;
+    struct json_object *humidity;
+    struct json_object *soil_moisture;
+    struct json_object *light;
+    struct json_object *water_level;
+    struct json_object *pump1;
+    struct json_object *pump2;
+    struct json_object *last_watered;
+} web_payload_t;
+
 // Raspberry Pi core structure
 typedef struct {
     hardware_interface_t *hardware;
     bool simulation_mode;
     char web_interface_url[256];
+    CURL *web_curl;              // Reused across sends to keep the connection alive
+    struct curl_slist *web_headers;
+    web_payload_t web_payload;
+    // Background sender: the monitoring loop hands over a serialized payload
+    // and carries on instead of waiting out the HTTP round trip
+    pthread_t web_thread;
+    bool web_thread_running;
+    pthread_mutex_t web_mutex;
+    pthread_cond_t web_cond;
+    char *web_outbox;            // Payload waiting for the sender thread
+    bool web_busy;               // Sender thread is posting
+    bool web_done;               // Post finished, result not yet reaped
+    bool web_ok;
+    bool web_stop_requested;
+    int web_inflight_count;      // Pending readings carried by the handed-over payload
+    sensor_data_t web_inflight_reading;
     bool running;
+    FILE *sensor_log;            // Optional binary log of every fresh reading
+    int sensor_log_unflushed;
+    int stop_pipe[2];            // Written by pi_core_request_stop to end a monitoring wait early
     plant_t active_plants[10];
+    int plant_by_position[MAX_PLANT_POSITIONS]; // Index into active_plants, -1 if no plant
     int active_plants_count;
+    unsigned int plants_version; // Bumped whenever plant settings or watering times change
+    bool monitor_interval_reset; // Manual command seen; monitoring drops back to its base interval
     system_status_t system_status;
 } raspberry_pi_core_t;
 
@@ -54,26 +120,29 @@ raspberry_pi_core_t* pi_core_init(bool simulation_mode, const char *web_interfac
 void pi_core_cleanup(raspberry_pi_core_t *core);
 
 sensor_data_t pi_core_read_all_sensors(raspberry_pi_core_t *core);
+sensor_data_t pi_core_read_all_sensors_fresh(raspberry_pi_core_t *core);
+int pi_core_sensor_history_stats(raspberry_pi_core_t *core, int count, sensor_data_t *mean, sensor_data_t *stddev);
 int pi_core_check_plants_needing_water(raspberry_pi_core_t *core, plant_t *plants_needing_water);
 bool pi_core_water_plant(raspberry_pi_core_t *core, const plant_t *plant);
+int pi_core_water_plants(raspberry_pi_core_t *core, const plant_t *plants, int count, bool *results);
 void pi_core_auto_water_plants(raspberry_pi_core_t *core);
 
 plant_validation_t pi_core_validate_plant_sensors(raspberry_pi_core_t *core, const plant_t *plant, const sensor_data_t *sensor_data);
 void pi_core_validate_sensor_readings(raspberry_pi_core_t *core, plant_validation_t *validation_results);
+bool pi_core_validation_ok(const plant_validation_t *validation);
 
 bool pi_core_send_data_to_web_interface(raspberry_pi_core_t *core, const sensor_data_t *sensor_data);
+bool pi_core_flush_web_data(raspberry_pi_core_t *core, bool force);
 void pi_core_start_monitoring_loop(raspberry_pi_core_t *core, int interval_seconds);
+void pi_core_request_stop(raspberry_pi_core_t *core);
+
+bool pi_core_open_sensor_log(raspberry_pi_core_t *core, const char *path);
+void pi_core_decode_sensor_log_record(const unsigned char *record, sensor_data_t *sensor_data);
+bool pi_core_wait_until(raspberry_pi_core_t *core, const struct timespec *deadline);
 
 void pi_core_get_system_status(raspberry_pi_core_t *core, char *status_json, size_t buffer_size);
 bool pi_core_manual_water_plant(raspberry_pi_core_t *core, int position);
-
-// Demo functions
-void demo_1_hardware_setup(void);
-void demo_2_pump_control(void);
-void demo_3_sensor_integration(void);
-void demo_4_data_integration(void);
-void demo_5_system_integration(void);
-void run_all_demos(void);
+bool pi_core_set_watering_frequency(raspberry_pi_core_t *core, int position, int days);
 
 // Utility functions
 void pi_core_log(const char *level, const char *format, ...);